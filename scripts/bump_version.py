@@ -1,16 +1,26 @@
-import tomlkit
+import re
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomlkit as tomllib
+
 # Read the pyproject.toml file
 pyproject_path = Path("pyproject.toml")
 with open(pyproject_path, "r") as f:
     content = f.read()
 
-# Parse the TOML content
-pyproject = tomlkit.parse(content)
+# Parse the TOML content (read-only; the write below only splices one line)
+pyproject = tomllib.loads(content)
 
 # Get the current version
-current_version = pyproject["tool"]["poetry"]["version"]
+if "version" in pyproject.get("project", {}):
+    section = "project"
+    current_version = pyproject["project"]["version"]
+else:
+    section = "tool.poetry"
+    current_version = pyproject["tool"]["poetry"]["version"]
 print(f"Current version: {current_version}")
 
 # Parse the version into parts
@@ -22,11 +32,14 @@ patch += 1
 new_version = f"{major}.{minor}.{patch}"
 print(f"New version: {new_version}")
 
-# Update the version in the TOML document
-pyproject["tool"]["poetry"]["version"] = new_version
+# Update the version line inside the section that defines it
+header = re.search(rf"(?m)^\[{re.escape(section)}\]\s*$", content)
+version_line = re.compile(r'(?m)^version\s*=\s*"[^"]+"')
+match = version_line.search(content, header.end())
+content = f'{content[:match.start()]}version = "{new_version}"{content[match.end():]}'
 
 # Write the updated content back to pyproject.toml
 with open(pyproject_path, "w") as f:
-    f.write(tomlkit.dumps(pyproject))
+    f.write(content)
 
 print("Version bumped successfully!")
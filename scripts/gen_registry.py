@@ -0,0 +1,77 @@
+"""
+Generate src/cli/_registry.py, the static list of Typer sub-apps.
+
+Mirrors the runtime discovery in cli.helpers.custom_typer.iter_typer_apps, but
+reads the modules with `ast` instead of importing them: every module in a
+subdirectory of the cli package that assigns a Typer app to a module-level
+name ending in `_app` is registered under the module's file name. Sub-apps are
+listed in the order discovery finds them, which is the order --help shows them in.
+
+Run after adding, renaming or removing a sub-app:
+
+    python scripts/gen_registry.py
+"""
+
+import ast
+from pathlib import Path
+
+CLI_DIR = Path(__file__).resolve().parent.parent / "src" / "cli"
+REGISTRY_PATH = CLI_DIR / "_registry.py"
+TYPER_FACTORIES = {"Typer", "CustomTyper"}
+SKIPPED_FILES = {"__init__.py", "commands.py", "config.py"}
+
+HEADER = '''"""
+Typer sub-apps registered on the root command, as (command name, "module:attribute").
+
+Generated by scripts/gen_registry.py; do not edit by hand.
+"""
+
+'''
+
+
+def _typer_app_names(tree: ast.Module) -> list:
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Call):
+            continue
+        func = node.value.func
+        factory = (
+            func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        )
+        if factory not in TYPER_FACTORIES:
+            continue
+        names.extend(
+            target.id
+            for target in node.targets
+            if isinstance(target, ast.Name) and target.id.endswith("_app")
+        )
+    return names
+
+
+def collect_subapps() -> list:
+    subapps = []
+    for py_file in CLI_DIR.rglob("*.py"):
+        if py_file.name in SKIPPED_FILES or py_file.parent == CLI_DIR:
+            continue
+        app_names = _typer_app_names(ast.parse(py_file.read_text(encoding="utf-8")))
+        if not app_names:
+            continue
+        module_name = ".".join(
+            ("cli",) + py_file.relative_to(CLI_DIR).with_suffix("").parts
+        )
+        # Runtime discovery takes the first match from dir(), i.e. alphabetical order
+        subapps.append((py_file.stem, f"{module_name}:{min(app_names)}"))
+    return subapps
+
+
+def render(subapps: list) -> str:
+    lines = [HEADER, "SUBAPPS = [\n"]
+    lines.extend(f'    ("{name}", "{target}"),\n' for name, target in subapps)
+    lines.append("]\n")
+    return "".join(lines)
+
+
+if __name__ == "__main__":
+    subapps = collect_subapps()
+    REGISTRY_PATH.write_text(render(subapps), encoding="utf-8")
+    print(f"Wrote {len(subapps)} sub-apps to {REGISTRY_PATH}")
@@ -0,0 +1,27 @@
+"""
+One-time .env loading for cx-cli.
+"""
+
+import functools
+import os
+
+# The marker is inherited by child processes, whose environment already has the .env values
+_DOTENV_MARKER = "_CX_CLI_DOTENV_LOADED"
+
+
+@functools.lru_cache(maxsize=None)
+def load_env_file() -> bool:
+    """
+    Load the nearest .env into os.environ, at most once per process tree.
+
+    Set CX_CLI_NO_DOTENV=1 to skip the lookup entirely (e.g. in CI).
+    Returns whether a .env file was loaded by this call.
+    """
+    if os.environ.get("CX_CLI_NO_DOTENV") or os.environ.get(_DOTENV_MARKER):
+        return False
+
+    from dotenv import load_dotenv
+
+    loaded = load_dotenv()
+    os.environ[_DOTENV_MARKER] = "1"
+    return loaded
@@ -0,0 +1,11 @@
+"""
+Typer sub-apps registered on the root command, as (command name, "module:attribute").
+
+Generated by scripts/gen_registry.py; do not edit by hand.
+"""
+
+SUBAPPS = [
+    ("deploy", "cli.deploy.deploy:deploy_commands_app"),
+    ("deployments", "cli.deployments.deployments:deployments_app"),
+    ("applications", "cli.applications.applications:applications_app"),
+]
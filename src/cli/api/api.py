@@ -5,7 +5,6 @@ import typer
 from cli.helpers.custom_typer import CustomTyper
 from cli.settings import api_validation_config
 from cli.api.helpers import get_app_schemas
-import questionary
 import subprocess
 from importlib import resources
 from contextlib import contextmanager
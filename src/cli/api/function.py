@@ -1,8 +1,11 @@
+import json
 import typer
-import os
 import yaml
+from pathlib import Path
 from cli.config import CONFIG_FILE
+from cli.helpers.yaml_io import Loader, Dumper, dump_atomic
 from cli.helpers.custom_typer import CustomTyper
+from cli.helpers.json_io import loads
 
 function_commands = CustomTyper(name="functions", help="Manage api functions")
 
@@ -42,10 +45,10 @@ def add_function(
     }
 
     # Load or initialize metadata
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE) as f:
-            metadata = yaml.safe_load(f) or {}
-    else:
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            metadata = yaml.load(f, Loader=Loader) or {}
+    except FileNotFoundError:
         metadata = {}
 
     # Merge new data
@@ -53,29 +56,71 @@ def add_function(
 
     # Save back to file
     with open(CONFIG_FILE, "w") as f:
-        yaml.dump(metadata, f, sort_keys=False)
+        yaml.dump(metadata, f, Dumper=Dumper, sort_keys=False)
 
     typer.echo(f"✅ Added function '{name}' to {CONFIG_FILE}")
 
 
+@function_commands.command("add-batch")
+def add_functions_batch(
+    specs_file: Path = typer.Argument(
+        ...,
+        help="JSON file with a list of function objects "
+        "(name, route, entryPoint and optionally language, method, roles)",
+    ),
+):
+    """Add many function definitions to metadata.yaml with a single read and write"""
+    try:
+        specs = loads(specs_file.read_bytes())
+        new_functions = {
+            spec["name"]: {
+                "language": spec.get("language", "Python"),
+                "method": spec.get("method", "GET").upper(),
+                "route": spec["route"].strip("/"),
+                "entryPoint": spec["entryPoint"],
+                "roles": spec.get("roles", ["viewer", "editor", "admin"]),
+            }
+            for spec in specs
+        }
+    except FileNotFoundError:
+        typer.secho(f"File not found: {specs_file}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    except (json.JSONDecodeError, TypeError, KeyError, AttributeError) as e:
+        typer.secho(
+            f"Invalid function specs in {specs_file}: {e}",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            metadata = yaml.load(f, Loader=Loader) or {}
+    except FileNotFoundError:
+        metadata = {}
+
+    metadata.setdefault("api", {}).setdefault("functions", {}).update(new_functions)
+    dump_atomic(metadata, CONFIG_FILE)
+
+    typer.echo(f"✅ Added {len(new_functions)} functions to {CONFIG_FILE}")
+
+
 @function_commands.command("destroy")
 def destroy_function(name):
     """Delete a function definition from metadata.yaml"""
     try:
         with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=Loader) or {}
 
         functions = data.get("api", {}).get("functions", {})
 
-        if name in functions:
-            del functions[name]
-            typer.echo(f"✅ Deleted function '{name}'")
-        else:
+        if name not in functions:
             typer.echo(f"Function '{name}' not found.")
+            return
 
-        # Save back to file
-        with open(CONFIG_FILE, "w") as f:
-            yaml.dump(data, f, sort_keys=False)
+        del functions[name]
+        dump_atomic(data, CONFIG_FILE)
+        typer.echo(f"✅ Deleted function '{name}'")
 
     except FileNotFoundError:
         typer.echo(f"File not found: {CONFIG_FILE}")
@@ -88,7 +133,7 @@ def list_functions():
     """List all function definitions in metadata.yaml"""
     try:
         with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=Loader) or {}
 
         functions = data.get("api", {}).get("functions", {})
 
@@ -1,13 +1,17 @@
+import os
+
 from cli.helpers.file import load_config
-from pathlib import Path
+
+SCHEMA_EXTENSIONS = frozenset({".yaml", ".yml", ".json"})
 
 
 def get_app_schemas():
-    valid_exts = {".yaml", ".yml", ".json"}
     config = load_config()
-    schemas_path = Path(config["core_services"]["openAPI"])
-    return [
-        str(file_path)
-        for file_path in schemas_path.iterdir()
-        if file_path.is_file() and file_path.suffix.lower() in valid_exts
-    ]
+    # scandir's DirEntry.is_file() uses the directory entry type, so no extra stat per file
+    with os.scandir(config["core_services"]["openAPI"]) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in SCHEMA_EXTENSIONS
+        ]
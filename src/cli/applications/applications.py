@@ -1,107 +1,207 @@
-import json
+import functools
+import operator
+import os
+import sys
+from typing import Iterable
+
 import typer
 
-from cli.helpers.api_client import APIClient
+from cli.helpers.api_client import get_client
 from cli.config import get_deployment_base_url
 from cli.helpers.errors import handle_env_error
+from cli.helpers.json_io import dumps, loads
+from cli.helpers.table import fit_to_terminal, truncate
 
 applications_app = typer.Typer(help="View all the applications in your account.")
 
 
-def _format_nullable(value):
-    return value if value not in (None, "") else "-"
-
-
-def _colorize_status(status: str) -> str:
-    """Return a colorized status label based on known values."""
+_STATUS_COLOR = {
+    "validation in progress": typer.colors.CYAN,
+    "deployment in progress": typer.colors.CYAN,
+    "deployed": typer.colors.GREEN,
+    "deployment failed": typer.colors.RED,
+    "partially successful": typer.colors.YELLOW,
+    "deployment canceled": typer.colors.MAGENTA,
+}
+
+
+_ANSI_FG = {
+    typer.colors.RED: 31,
+    typer.colors.GREEN: 32,
+    typer.colors.YELLOW: 33,
+    typer.colors.MAGENTA: 35,
+    typer.colors.CYAN: 36,
+}
+_STATUS_STYLED = {
+    status: f"\x1b[{_ANSI_FG[color]}m%s\x1b[0m"
+    for status, color in _STATUS_COLOR.items()
+}
+
+
+def _use_color() -> bool:
+    """Color only when writing to a terminal and NO_COLOR (https://no-color.org) is unset."""
+    return sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
+@functools.lru_cache(maxsize=64)
+def _colorize_status(status: str, shown: str = None) -> str:
+    """
+    Return a colorized status label based on known values.
+    `shown` is the (possibly truncated) text to display; the color comes from `status`.
+    """
     if not status or status == "-":
         return "-"
     raw = str(status)
-    s = raw.strip().lower()
-    if s in {"validation in progress", "deployment in progress"}:
-        return typer.style(raw, fg=typer.colors.CYAN)
-    if s in {"deployed"}:
-        return typer.style(raw, fg=typer.colors.GREEN)
-    if s in {"deployment failed"}:
-        return typer.style(raw, fg=typer.colors.RED)
-    if s in {"partially successful"}:
-        return typer.style(raw, fg=typer.colors.YELLOW)
-    if s in {"deployment canceled"}:
-        return typer.style(raw, fg=typer.colors.MAGENTA)
-
-    return raw
-
-
-def _pad_styled(raw_text: str, width: int, styled_text: str) -> str:
-    """Pad using raw text length, append spaces after the styled text to align columns."""
-    raw_len = len(str(raw_text))
-    pad = max(0, width - raw_len)
-    return f"{styled_text}{' ' * pad}"
-
-
-def _print_applications_table(items: list[dict]) -> None:
-    rows = []
-    for app in items:
-        name = (
-            app.get("name") or app.get("displayName") or app.get("display_name") or "-"
-        )
-        app_id = (
-            app.get("id")
-            or app.get("application_uid")
-            or app.get("applicationId")
-            or "-"
-        )
-        status = app.get("activeStatus") or app.get("status")
-        version = app.get("activeVersion") or app.get("version")
-        lead = app.get("leadDeveloper") or app.get("leadDeveloperEmail")
-        last_time = app.get("lastDeploymentTime") or app.get("lastDeploymentTime")
-        rows.append(
-            [
-                str(name),
-                str(app_id),
-                _format_nullable(status),
-                _format_nullable(version),
-                _format_nullable(lead),
-                _format_nullable(last_time),
-            ]
-        )
+    text = raw if shown is None else shown
+    template = _STATUS_STYLED.get(raw.strip().lower())
+    return template % text if template else text
+
+
+TABLE_HEADERS = (
+    "Name",
+    "ID",
+    "Status",
+    "Version",
+    "Lead Developer",
+    "Last Deployment",
+)
+# Column widths cap long cells so rows can be printed as they are read; they shrink to fit the terminal
+COLUMN_WIDTHS = (40, 36, 22, 12, 40, 24)
+COLUMN_GAP = 2
+FLUSH_EVERY = 64
+
+
+@functools.lru_cache(maxsize=8)
+def _row_templates(widths: tuple) -> tuple:
+    """
+    Return (styled, plain) %-templates for a row, so each row is a single
+    %-format call. The styled one takes the status as (styled text, padding)
+    since ANSI codes have no width.
+    """
+    gap = " " * COLUMN_GAP
+    styled = gap.join(
+        "%s%s" if i == 2 else "%%-%ds" % width for i, width in enumerate(widths)
+    )
+    plain = gap.join("%%-%ds" % width for width in widths)
+    return styled, plain
 
-    headers = [
-        "Name",
-        "ID",
-        "Status",
-        "Version",
-        "Lead Developer",
-        "Last Deployment",
-    ]
-
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-
-    typer.echo("")
-    header_line = "  ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-    separator = "  ".join("-" * col_widths[i] for i in range(len(headers)))
-    typer.secho(header_line, fg=typer.colors.BRIGHT_BLUE)
-    typer.secho(separator, fg=typer.colors.BLUE)
-
-    for row in rows:
-        name_cell = str(row[0]).ljust(col_widths[0])
-        id_cell = str(row[1]).ljust(col_widths[1])
-        raw_status = str(row[2])
-        colored_status = _colorize_status(raw_status)
-        status_cell = _pad_styled(raw_status, col_widths[2], colored_status)
-        version_cell = str(row[3]).ljust(col_widths[3])
-        lead_cell = str(row[4]).ljust(col_widths[4])
-        last_cell = str(row[5]).ljust(col_widths[5])
-
-        line = "  ".join(
-            [name_cell, id_cell, status_cell, version_cell, lead_cell, last_cell]
-        )
-        typer.echo(line)
 
-    typer.echo("")
+# Each column takes the first of these keys that is present and not empty, in order
+FIELD_KEYS = (
+    ("name", "displayName", "display_name"),
+    ("id", "application_uid", "applicationId"),
+    ("activeStatus", "status"),
+    ("activeVersion", "version"),
+    ("leadDeveloper", "leadDeveloperEmail"),
+    ("lastDeploymentTime",),
+)
+
+
+def _is_empty(value) -> bool:
+    """Missing, null and "" cells show as "-"; other falsy values such as 0 are real data."""
+    return value is None or value == ""
+
+
+def _first_present(app: dict, keys: tuple) -> str:
+    for key in keys:
+        value = app.get(key)
+        if not _is_empty(value):
+            return str(value)
+    return "-"
+
+
+def _row_extractor(sample: dict):
+    """
+    Build a row extractor for items shaped like `sample`.
+
+    The key each column resolves to in `sample` is fetched for every row with a
+    single itemgetter call; the full fallback chain only runs for cells that
+    come back empty or rows missing one of those keys.
+    """
+    resolved = tuple(
+        next((key for key in keys if not _is_empty(sample.get(key))), keys[0])
+        for keys in FIELD_KEYS
+    )
+    fast = operator.itemgetter(*resolved)
+    empty = (None,) * len(FIELD_KEYS)
+
+    def extract(app: dict) -> list:
+        try:
+            values = fast(app)
+        except KeyError:
+            values = empty
+        return [
+            _first_present(app, keys) if _is_empty(value) else str(value)
+            for value, keys in zip(values, FIELD_KEYS)
+        ]
+
+    return extract
+
+
+def _stdout_closed() -> None:
+    """Handle a closed stdout pipe (e.g. `| head`) by silencing the rest of the output."""
+    # Point stdout at devnull so the interpreter's final flush doesn't raise again
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    raise typer.Exit(0)
+
+
+def _write_lines(lines: list) -> None:
+    """Write lines to stdout in one echo, which strips or translates ANSI codes as needed."""
+    try:
+        typer.echo("\n".join(lines))
+    except BrokenPipeError:
+        _stdout_closed()
+
+
+def _write_bytes(chunks: Iterable[bytes]) -> None:
+    """Write raw chunks straight to the stdout buffer, followed by a newline."""
+    try:
+        sys.stdout.flush()
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    except BrokenPipeError:
+        _stdout_closed()
+
+
+def _print_applications_table(items: Iterable[dict]) -> None:
+    widths = fit_to_terminal(COLUMN_WIDTHS, COLUMN_GAP)
+    row_template, plain_row_template = _row_templates(widths)
+    gap = " " * COLUMN_GAP
+    header_line = gap.join(
+        truncate(h, widths[i]).ljust(widths[i]) for i, h in enumerate(TABLE_HEADERS)
+    )
+    separator = gap.join("-" * width for width in widths)
+    use_color = _use_color()
+    if use_color:
+        header_line = typer.style(header_line, fg=typer.colors.BRIGHT_BLUE)
+        separator = typer.style(separator, fg=typer.colors.BLUE)
+
+    # Lines are written in batches, so a typical table goes out in a single write
+    pending = ["", header_line, separator]
+    extract = None
+    for app in items:
+        if extract is None:
+            extract = _row_extractor(app)
+        full_row = extract(app)
+        row = [truncate(cell, widths[i]) for i, cell in enumerate(full_row)]
+
+        if use_color:
+            status_cell = _colorize_status(full_row[2], row[2])
+            status_pad = " " * (widths[2] - len(row[2]))
+            line = row_template % (
+                row[0], row[1], status_cell, status_pad, row[3], row[4], row[5]
+            )
+        else:
+            line = plain_row_template % tuple(row)
+        pending.append(line)
+        if len(pending) >= FLUSH_EVERY:
+            _write_lines(pending)
+            pending.clear()
+
+    pending.append("")
+    _write_lines(pending)
 
 
 @applications_app.command("list")
@@ -112,28 +212,33 @@ def list_applications(
         help="Custom path to the credentials file. Uses default location if not specified.",
     ),
     json_output: bool = typer.Option(False, "--json", help="Display output in raw JSON format"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent the --json output"),
 ):
     """Retrieve and display all applications associated with your account."""
     handle_env_error(env)
-    api = APIClient(
+    api = get_client(
         base_url=get_deployment_base_url(env), env=env, creds_path=creds_path
     )
 
-    resp = api.get("/cli/applications")
+    resp = api.get("/cli/applications", stream=json_output)
     if resp.status_code != 200:
         typer.secho(
             f"Failed to fetch applications: {resp.status_code} {resp.text}",
             fg=typer.colors.RED,
         )
         raise typer.Exit(1)
-    data = resp.json()
 
+    if json_output:
+        # The body is already JSON; only parse it when it has to be re-indented
+        if pretty:
+            _write_bytes([dumps(loads(resp.content), indent=True)])
+        else:
+            _write_bytes(resp.iter_content(65536))
+        return
+
+    data = resp.json()
     items = data.get("items", [])
     total = data.get("total", len(items))
     typer.secho(f"Applications (total {total}):", fg=typer.colors.BRIGHT_BLUE)
 
-    if json_output:
-        typer.echo(json.dumps(data, indent=2))
-        return
-
-    _print_applications_table(items)
+    _print_applications_table(app for app in items)
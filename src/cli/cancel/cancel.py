@@ -1,5 +1,5 @@
 import typer
-from cli.helpers.api_client import APIClient
+from cli.helpers.api_client import get_client
 from cli.config import get_deployment_base_url
 
 
@@ -19,7 +19,7 @@ def cancel(
         f"Try to Cancel the deployment for: {deployment_id}",
         fg=typer.colors.BRIGHT_BLUE,
     )
-    api = APIClient(base_url=get_deployment_base_url(env), env=env)
+    api = get_client(base_url=get_deployment_base_url(env), env=env)
     response = api.post(
         f"/cancel/{deployment_id}", headers={"Content-Type": "application/json"}
     )
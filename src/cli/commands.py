@@ -1,30 +1,70 @@
+import codecs
+import functools
+import os
+import sys
+
 import typer
-from cli.helpers.custom_typer import find_and_add_typer_apps
-from cli.init.init import init
-from cli.register.register import register
-from cli.cancel.cancel import cancel
-from cli.dry_run.dry_run import dry_run
-from cli.validate.validate import validate
-from cli.helpers.cache_manager import (
-    VersionManager,
-)
+from cli.helpers.custom_typer import LazyTyperGroup
 from cli.settings import version_check_config
 
-app = typer.Typer()
-version_manager = VersionManager()
+try:
+    from cli._registry import SUBAPPS
+except ImportError:  # registry not generated; fall back to scanning the package
+    SUBAPPS = []
+
+
+class CliGroup(LazyTyperGroup):
+    # Imported only when the command runs (or when --help lists everything)
+    lazy_commands = {
+        "init": "cli.init.init:init",
+        "register": "cli.register.register:register",
+        "cancel": "cli.cancel.cancel:cancel",
+        "dry-run": "cli.dry_run.dry_run:dry_run",
+        "validate": "cli.validate.validate:validate",
+    }
+    # Generated by scripts/gen_registry.py
+    lazy_subapps = dict(SUBAPPS)
+
+
+app = typer.Typer(cls=CliGroup)
+
+
+def _stdout_is_utf8() -> bool:
+    try:
+        return codecs.lookup(sys.stdout.encoding or "ascii").name == "utf-8"
+    except LookupError:
+        return False
+
+
+# Emoji markers fall back to ASCII when stdout can't encode them (e.g. cp1252 consoles, C locale)
+_UTF8 = _stdout_is_utf8()
+OK = "✅" if _UTF8 else "[OK]"
+UP = "⬆️ " if _UTF8 else "[UP]"
+FAIL = "❌" if _UTF8 else "[FAIL]"
+
+
+@functools.lru_cache(maxsize=1)
+def get_version_manager():
+    """Build the VersionManager on first use so commands that don't need it skip the cache read."""
+    from cli.helpers.cache_manager import VersionManager
+
+    return VersionManager()
 
 
 def version_check_callback():
+    if os.environ.get("CX_CLI_SKIP_VERSION_CHECK") == "1":
+        return
     try:
         # Skip version check if disabled in config
         if not version_check_config.check_enabled:
             return
 
+        version_manager = get_version_manager()
         if version_manager.is_up_to_date():
-            typer.echo("✅ You are using the latest CLI version.")
+            typer.echo(f"{OK} You are using the latest CLI version.")
         else:
             typer.echo(
-                f"⬆️  A new CLI version is available: {version_manager.latest_version}, and you are using {version_manager.installed_version}."
+                f"{UP} A new CLI version is available: {version_manager.latest_version}, and you are using {version_manager.installed_version}."
             )
             typer.echo("\nPlease update to the latest CLI version:")
             typer.echo("  cx-cli upgrade")
@@ -56,7 +96,7 @@ def main(ctx: typer.Context):
 @app.command()
 def version():
     """Display the current CLI version."""
-    typer.echo(f"cx-cli version {version_manager.installed_version}")
+    typer.echo(f"cx-cli version {get_version_manager().installed_version}")
 
 
 @app.command()
@@ -76,6 +116,7 @@ def upgrade(
     force: bool = typer.Option(False, "--force", "-f", help="Force upgrade even if already on the latest version.")
 ):
     """Upgrade the cx-cli to the latest version."""
+    version_manager = get_version_manager()
     if not version_manager.is_up_to_date():
         typer.echo(
             f"Current version: {version_manager.installed_version}\n"
@@ -83,7 +124,7 @@ def upgrade(
         )
     elif not force:
         typer.echo(
-            f"✅ Already running the latest version: {version_manager.installed_version}"
+            f"{OK} Already running the latest version: {version_manager.installed_version}"
         )
         return
 
@@ -97,12 +138,12 @@ def upgrade(
     success, message = version_manager.upgrade_cli(method)
 
     if success:
-        typer.echo(f"✅ {message}")
+        typer.echo(f"{OK} {message}")
         typer.echo(
             "Please restart your terminal or run the command again to use the new version."
         )
     else:
-        typer.echo(f"❌ {message}", err=True)
+        typer.echo(f"{FAIL} {message}", err=True)
         raise typer.Exit(1)
 
 
@@ -131,33 +172,27 @@ def config_set(
         bool_value = value.lower() == "true"
         if key == "version-check-enabled":
             version_check_config.check_enabled = bool_value
-            typer.echo(f"✅ Set {key} to {bool_value}")
+            typer.echo(f"{OK} Set {key} to {bool_value}")
             return
 
     # Handle other values
     version_check_config.set(key, value)
-    typer.echo(f"✅ Set {key} to {value}")
+    typer.echo(f"{OK} Set {key} to {value}")
 
 
 @config_app.command("list")
 def config_list():
     """List all configuration settings."""
-    config_file = version_check_config.config_file
-    if not config_file.exists():
+    # The settings were read once at startup; no need to stat the file again
+    if not version_check_config.file_found:
         typer.echo("No configuration file found. Using defaults.")
         typer.echo("  version-check-enabled: true")
         return
 
-    typer.echo(f"Configuration file: {config_file}")
-    typer.echo("\nSettings:")
-    for key, value in version_check_config._config.items():
-        typer.echo(f"  {key}: {value}")
-
-
-app.command()(init)
-app.command()(register)
-app.command()(cancel)
-app.command(name="dry-run")(dry_run)
-app.command()(validate)
-
-find_and_add_typer_apps(app)
+    typer.echo(f"Configuration file: {version_check_config.config_file}")
+    typer.echo(
+        "\n".join(
+            ["\nSettings:"]
+            + [f"  {key}: {value}" for key, value in version_check_config._config.items()]
+        )
+    )
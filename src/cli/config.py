@@ -1,8 +1,9 @@
 import os
-from dotenv import load_dotenv
 from enum import Enum
 
-load_dotenv()
+from cli._env import load_env_file
+
+load_env_file()
 
 
 CONFIG_FILE = "lifecycle_config.yaml"
@@ -21,22 +22,37 @@ class Environment(str, Enum):
 
 
 BASE_URL_BY_ENV = {
-    Environment.SANDBOX.value: "https://sbx.cxp.cisco.com",
-    Environment.DEV.value: "https://dev.cxp.cisco.com",
-    Environment.NPRD.value: "https://nprd.cxp.cisco.com",
-    Environment.PROD.value: "https://prod.cxp.cisco.com",
+    Environment.SANDBOX: "https://sbx.cxp.cisco.com",
+    Environment.DEV: "https://dev.cxp.cisco.com",
+    Environment.NPRD: "https://nprd.cxp.cisco.com",
+    Environment.PROD: "https://prod.cxp.cisco.com",
 }
 
-ENVIRONMENTS = [env.value for env in Environment]
+# Ordered names for help text and error messages; the frozenset is for membership checks
+ENVIRONMENT_NAMES = tuple(env.value for env in Environment)
+ENVIRONMENTS = frozenset(ENVIRONMENT_NAMES)
+
+
+def get_iam_base_url(env: str) -> str:
+    """
+    Get the IAM base URL for the environment.
+    """
+    return BASE_URL_BY_ENV[Environment(env)]
+
+
+_DEPLOYMENT_URL = {
+    env.value: f"{base}/lifecycle/api/v1/deployment"
+    for env, base in BASE_URL_BY_ENV.items()
+}
 
 
 def get_deployment_base_url(env: str) -> str:
     """
     Get the deployment base URL based on the environment.
     """
-    if env not in ENVIRONMENTS:
+    try:
+        return _DEPLOYMENT_URL[env]
+    except KeyError:
         raise ValueError(
-            f"Invalid environment: {env}. Valid environments are: {ENVIRONMENTS}"
-        )
-
-    return f"{BASE_URL_BY_ENV[env]}/lifecycle/api/v1/deployment"
+            f"Invalid environment: {env}. Valid environments are: {list(ENVIRONMENT_NAMES)}"
+        ) from None
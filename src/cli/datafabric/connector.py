@@ -1,10 +1,13 @@
-import os
+import json
+from pathlib import Path
 
 import typer
 import yaml
 
 from cli.config import CONFIG_FILE
 from cli.helpers.custom_typer import CustomTyper
+from cli.helpers.json_io import loads
+from cli.helpers.yaml_io import Loader, Dumper, dump_atomic
 
 connectors_commands = CustomTyper(
     name="connectors", help="Manage Data Fabric connectors"
@@ -25,10 +28,10 @@ def add_connector(
     """Add a connector to metadata.yaml under datafabric.connectors"""
 
     # Load or create metadata.yaml
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, "r") as f:
-            metadata = yaml.safe_load(f) or {}
-    else:
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            metadata = yaml.load(f, Loader=Loader) or {}
+    except FileNotFoundError:
         metadata = {}
 
     # Update or insert the connector
@@ -38,30 +41,64 @@ def add_connector(
 
     # Save back to file
     with open(CONFIG_FILE, "w") as f:
-        yaml.dump(metadata, f, sort_keys=False)
+        yaml.dump(metadata, f, Dumper=Dumper, sort_keys=False)
 
     typer.echo(
         f"✅ Added connector '{connector_name}' with route '{route}' to {CONFIG_FILE}"
     )
 
 
+@connectors_commands.command("add-batch")
+def add_connectors_batch(
+    specs_file: Path = typer.Argument(
+        ..., help='JSON file with a list of {"name": ..., "route": ...} objects'
+    ),
+):
+    """Add many connectors to metadata.yaml with a single read and write"""
+    try:
+        specs = loads(specs_file.read_bytes())
+        new_connectors = {spec["name"]: spec["route"] for spec in specs}
+    except FileNotFoundError:
+        typer.secho(f"File not found: {specs_file}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    except (json.JSONDecodeError, TypeError, KeyError) as e:
+        typer.secho(
+            f"Invalid connector specs in {specs_file}: {e}",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            metadata = yaml.load(f, Loader=Loader) or {}
+    except FileNotFoundError:
+        metadata = {}
+
+    metadata.setdefault("datafabric", {}).setdefault("connectors", {}).update(
+        new_connectors
+    )
+    dump_atomic(metadata, CONFIG_FILE)
+
+    typer.echo(f"✅ Added {len(new_connectors)} connectors to {CONFIG_FILE}")
+
+
 @connectors_commands.command("destroy")
 def destroy_connector(connector_name):
     """Delete a connector from the YAML file if the name matches."""
     try:
         with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=Loader)
 
         connectors = data.get("datafabric", {}).get("connectors", {})
 
-        if connector_name in connectors:
-            del data["datafabric"]["connectors"][connector_name]
-            print(f"Deleted connector: {connector_name}")
-        else:
+        if connector_name not in connectors:
             print(f"Connector '{connector_name}' not found.")
+            return
 
-        with open(CONFIG_FILE, "w") as f:
-            yaml.safe_dump(data, f, sort_keys=False)
+        del data["datafabric"]["connectors"][connector_name]
+        dump_atomic(data, CONFIG_FILE)
+        print(f"Deleted connector: {connector_name}")
 
     except FileNotFoundError:
         print(f"File not found: {CONFIG_FILE}")
@@ -74,7 +111,7 @@ def list_connectors():
     """List all connectors defined in the metadata.yaml file."""
     try:
         with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=Loader)
 
         connectors = data.get("datafabric", {}).get("connectors", {})
         if not connectors:
@@ -2,17 +2,41 @@ from cli.config import CONFIG_FILE
 import uuid
 import os
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import fnmatch
+import functools
+import hashlib
+import math
+import mmap
+import queue
+import re
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from datetime import datetime
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
 
 import requests
 import typer
-from sseclient import SSEClient
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeRemainingColumn,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from cli.helpers.custom_typer import CustomTyper
-from cli.config import get_deployment_base_url, BASE_URL_BY_ENV
-from cli.helpers.api_client import APIClient
+from cli.config import get_deployment_base_url, get_iam_base_url
+from cli.helpers.api_client import APIClient, get_client
 from cli.helpers.file import load_config, load_env, inject_env_into_schema
+from cli.helpers.json_io import loads
 from cli.helpers.errors import handle_env_error
 from cli.helpers.path_utils import (
     get_lifecycle_path,
@@ -21,21 +45,423 @@ from cli.helpers.path_utils import (
     join_s3_path,
 )
 from cli.helpers.prompts import prompt_service_selection
+from cli.helpers.sse import stream_event_data
 from cli.helpers.status import get_status_color
 from cli.register.register import create_application_in_developer_studio
 
 deploy_commands_app = CustomTyper(name="deploy", help="Deploy your application to the platform.")
+
+# Uploads wait on the network, not the CPU: N files at latency L take about N * L / workers.
+# Overridden by --upload-concurrency or CXP_UPLOAD_CONCURRENCY.
+UPLOAD_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+UPLOAD_BLOCK_SIZE = 1024 * 1024  # bytes sent per socket write when streaming a file
+SMALL_UPLOAD_SIZE = 64 * 1024  # files below this size are read into memory in one go
+MULTIPART_PART_SIZE = 16 * 1024 * 1024  # files larger than one part are uploaded in parallel parts
+MULTIPART_MAX_WORKERS = 8
+DIRECT_UPLOAD_MAX_SIZE = 1024 * 1024  # without a batch presign, smaller files are posted to the backend
+UPLOAD_QUEUE_SIZE = 256  # files found but not yet handed to the upload pool
+PRESIGN_BATCH_SIZE = 64
+JSON_HEADERS = {"Content-Type": "application/json"}
+S3_PUT_HEADERS = {
+    "Content-Type": "application/octet-stream",
+    "x-amz-server-side-encryption": "aws:kms",
+}
+
+# Never uploaded; more names or glob patterns can be listed under `deploy_exclude` in the config
+# or, one per line, in lifecycle/.deployignore
+DEPLOY_IGNORE_FILE = ".deployignore"
+EXCLUDED_DIRS = frozenset({".git", "__pycache__"})
+EXCLUDED_FILE_SUBSTRINGS = (".example",)  # anywhere in the name, e.g. "connectors.example.json"
+_has_excluded_substring = re.compile("|".join(map(re.escape, EXCLUDED_FILE_SUBSTRINGS))).search
+
+# Responses worth retrying; anything else fails the upload and cancels the rest
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Backend endpoints that answered 404; the caller falls back to the single-request flow
+_UNSUPPORTED_ENDPOINTS = set()
+
+
+@functools.lru_cache(maxsize=64)
+def _proxy_for(origin: str):
+    """The proxy requests would use for origin ("scheme://host[:port]"), or None if NO_PROXY exempts it."""
+    return requests.utils.get_environ_proxies(origin).get(urlsplit(origin).scheme)
+
+
+class _S3Pool:
+    """
+    urllib3 pools for presigned S3 uploads, sending each request direct or through
+    the environment's proxy the way requests would, NO_PROXY included.
+    """
+
+    def __init__(self, **pool_kwargs):
+        import urllib3
+
+        self._pool_kwargs = pool_kwargs
+        self._direct = urllib3.PoolManager(**pool_kwargs)
+        self._proxied = {}
+
+    def request(self, method: str, url: str, **kwargs):
+        parts = urlsplit(url)
+        proxy = _proxy_for(f"{parts.scheme}://{parts.netloc}")
+        if proxy is None:
+            return self._direct.request(method, url, **kwargs)
+        pool = self._proxied.get(proxy)
+        if pool is None:
+            import urllib3
+
+            pool = self._proxied.setdefault(
+                proxy, urllib3.ProxyManager(proxy, **self._pool_kwargs)
+            )
+        return pool.request(method, url, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_s3_pool(maxsize: int = UPLOAD_MAX_WORKERS) -> _S3Pool:
+    """
+    Shared urllib3 pool for presigned S3 uploads so TLS connections are kept alive across files.
+    The PUTs go straight to urllib3 to skip the per-request overhead of a requests Session.
+    maxsize should match the number of upload workers, or extra connections are discarded.
+    """
+    import certifi
+    from urllib3.util.retry import Retry
+
+    return _S3Pool(
+        num_pools=4,
+        maxsize=maxsize,
+        # PUTs are idempotent and urllib3 rewinds file bodies before retrying
+        retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=TRANSIENT_STATUSES,
+            raise_on_status=False,
+        ),
+        blocksize=UPLOAD_BLOCK_SIZE,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.getenv("REQUESTS_CA_BUNDLE") or certifi.where(),
+    )
+
+
+class UploadTask(NamedTuple):
+    """A file to upload and the S3 key it goes to."""
+
+    service: str
+    file_path: str
+    file_name: str
+    size: int
+    s3_key: str
+    folder_path: str
+    multipart: bool = False
+    direct: bool = False  # small enough to post to the backend when no presigned URL is at hand
+    copy_of: Optional[str] = None  # key of an earlier file with the same content, copied server side
+
+
+def _post_optional(api: APIClient, endpoint: str, payload: dict = None, **kwargs):
+    """
+    POST to a backend endpoint that may not be deployed yet; returns None if it isn't.
+    `payload` is sent as JSON; other keyword arguments go to the request as-is.
+    """
+    if endpoint in _UNSUPPORTED_ENDPOINTS:
+        return None
+    if payload is not None:
+        kwargs.update(json=payload, headers=JSON_HEADERS)
+    response = api.post(endpoint, **kwargs)
+    if response.status_code == 404:
+        _UNSUPPORTED_ENDPOINTS.add(endpoint)
+        return None
+    return response
+
+
+def _never_excluded(name: str, path: str) -> None:
+    return None
+
+
+def _glob_matcher(patterns: list):
+    if not patterns:
+        return lambda value: None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns)).match
+
+
+@functools.lru_cache(maxsize=8)
+def _exclusion_matcher(patterns: tuple):
+    """
+    Compile the exclusion globs into one case-sensitive match function taking a file or
+    folder name and its POSIX path relative to the service folder. Patterns containing
+    "/" match the path (a leading "/" is dropped); the others match the name at any depth.
+    """
+    if not patterns:
+        return _never_excluded
+    match_name = _glob_matcher([pattern for pattern in patterns if "/" not in pattern])
+    match_path = _glob_matcher(
+        [pattern.lstrip("/") for pattern in patterns if "/" in pattern]
+    )
+    return lambda name, path: match_name(name) or match_path(path)
+
+
+def _supported_patterns(labelled_patterns) -> tuple:
+    """
+    Take (origin, pattern) pairs and return the patterns the exclusions can express.
+    A trailing "/" is dropped, as patterns match files and folders alike. The `!`
+    negations gitignore allows are dropped with a warning naming their origin.
+    """
+    patterns = []
+    for origin, pattern in labelled_patterns:
+        if pattern.startswith("!"):
+            typer.secho(
+                f"⚠️  {origin}: negated pattern '{pattern}' is not supported and was ignored.",
+                fg=typer.colors.YELLOW,
+                err=True,
+            )
+        else:
+            patterns.append(pattern.rstrip("/"))
+    return tuple(patterns)
+
+
+def _read_ignore_file(path) -> tuple:
+    """Read the glob patterns in a .deployignore file, skipping blank lines and # comments."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [(number, line.strip()) for number, line in enumerate(f, start=1)]
+    except OSError:
+        return ()
+    return _supported_patterns(
+        (f"{path}:{number}", line)
+        for number, line in lines
+        if line and not line.startswith("#")
+    )
+
+
+def _iter_files(
+    root: str, is_excluded=_never_excluded, pruned: list = None, prefix: str = ""
+):
+    """
+    Yield a DirEntry for every file under root, like os.walk without the per-file stat.
+
+    Excluded directories (EXCLUDED_DIRS, or entries `is_excluded` matches by name and
+    relative path) are pruned without being listed and their paths appended to `pruned`,
+    if given. Excluded files (EXCLUDED_FILE_SUBSTRINGS, or entries `is_excluded` matches)
+    are skipped. `prefix` is root's POSIX path relative to the top of the walk.
+    Directory symlinks aren't followed and unreadable directories are skipped, as with os.walk.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            path = prefix + name
+            if entry.is_dir(follow_symlinks=False):
+                if name not in EXCLUDED_DIRS and not is_excluded(name, path):
+                    yield from _iter_files(entry.path, is_excluded, pruned, path + "/")
+                elif pruned is not None:
+                    pruned.append(entry.path)
+            elif _has_excluded_substring(name):
+                continue
+            elif entry.is_file() and not is_excluded(name, path):
+                yield entry
+
+
+def _is_template(file_path: str) -> bool:
+    """Whether a file gets the env vars injected before it is uploaded."""
+    return file_path.endswith(".json") or file_path.endswith(".yaml")
+
+
+def _uses_multipart(file_path: str, size: int) -> bool:
+    return not _is_template(file_path) and size > MULTIPART_PART_SIZE
+
+
+def _direct_upload(api: APIClient, task: UploadTask, body: bytes):
+    """
+    Send a small file to the backend in one request instead of presign + PUT.
+
+    Returns None on success, an error message on failure, or NotImplemented
+    when the backend has no direct upload endpoint.
+    """
+    response = _post_optional(
+        api,
+        "s3/direct_upload",
+        files={"file": (task.file_name, body, "application/octet-stream")},
+        data={"key": task.s3_key},
+        # Drop the session's JSON content type so requests sets the multipart one
+        headers={"Content-Type": None},
+    )
+    if response is None:
+        return NotImplemented
+    if response.status_code != 200:
+        return f"Direct upload failed for {task.file_path}: HTTP {response.status_code}"
+    return None
+
+
+def _copy_object(api: APIClient, source_key: str, task: UploadTask):
+    """
+    Copy an object already uploaded under source_key to the task's key, server side.
+
+    Returns None on success, an error message on failure, or NotImplemented
+    when the backend has no copy endpoint.
+    """
+    response = _post_optional(api, "s3/copy_object", {"src": source_key, "dst": task.s3_key})
+    if response is None:
+        return NotImplemented
+    if response.status_code != 200:
+        return f"Copy failed for {task.file_path}: HTTP {response.status_code}"
+    return None
+
+
+def _content_hash(file_path: str, env_vars: dict):
+    """
+    BLAKE2b digest of the bytes an upload would send, so files with the same content
+    can be copied server side instead of uploaded again.
+    Returns None if the file can't be read or rendered; the upload then reports the error.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        if _is_template(file_path):
+            digest.update(inject_env_into_schema(file_path, env_vars))
+        else:
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(UPLOAD_BLOCK_SIZE), b""):
+                    digest.update(block)
+    except Exception:
+        return None
+    return digest.hexdigest()
+
+
+def _presign_batch(api: APIClient, keys: list) -> dict:
+    """
+    Presign the single-PUT uploads in one request; returns {key: url}.
+    An empty map means the backend has no batch endpoint and each upload presigns its own URL.
+    """
+    if not keys:
+        return {}
+    response = _post_optional(api, "s3/generate_presigned_urls_batch", {"keys": keys})
+    if response is None or response.status_code != 200:
+        return {}
+    return response.json().get("urls", {})
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    retry=retry_if_exception_type(requests.exceptions.ConnectionError)
+    | retry_if_result(lambda response: response.status_code in TRANSIENT_STATUSES),
+    retry_error_callback=lambda state: state.outcome.result(),
+)
+def _presign(api: APIClient, key: str):
+    """Presign a single upload, retrying connection errors and transient statuses."""
+    return api.post(
+        "s3/generate_presigned_url",
+        json={"key": key},
+        headers=JSON_HEADERS,
+    )
+
+
+def _upload_part(s3_pool, url: str, file_path: str, offset: int, length: int) -> str:
+    """PUT one part of a multipart upload from a memory map of the file and return its ETag."""
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), length, offset=offset, access=mmap.ACCESS_READ
+    ) as part:
+        response = s3_pool.request(
+            "PUT", url, body=part, headers={"Content-Length": str(length)}
+        )
+    if response.status != 200:
+        raise RuntimeError(f"HTTP {response.status} for part at offset {offset}")
+    return response.headers["ETag"]
+
+
+def _multipart_upload(api: APIClient, s3_pool, task: UploadTask, file_size: int):
+    """
+    Upload a large file as parallel S3 multipart parts.
+
+    Returns None on success, an error message on failure, or NotImplemented
+    when the backend has no multipart endpoints so the caller can fall back
+    to a single PUT.
+    """
+    key = task.s3_key
+    response = _post_optional(api, "s3/create_multipart", {"key": key})
+    if response is None:
+        return NotImplemented
+    if response.status_code != 200:
+        return f"Failed to start multipart upload for {task.file_path}: {response.text}"
+    upload_id = response.json()["upload_id"]
+
+    try:
+        part_count = math.ceil(file_size / MULTIPART_PART_SIZE)
+        response = api.post(
+            "s3/presign_part",
+            json={
+                "key": key,
+                "upload_id": upload_id,
+                "part_numbers": list(range(1, part_count + 1)),
+            },
+            headers=JSON_HEADERS,
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"failed to presign parts: {response.text}")
+        urls = response.json()["urls"]
+
+        with ThreadPoolExecutor(max_workers=MULTIPART_MAX_WORKERS) as executor:
+            etags = executor.map(
+                lambda number: _upload_part(
+                    s3_pool,
+                    urls[str(number)],
+                    task.file_path,
+                    (number - 1) * MULTIPART_PART_SIZE,
+                    min(MULTIPART_PART_SIZE, file_size - (number - 1) * MULTIPART_PART_SIZE),
+                ),
+                range(1, part_count + 1),
+            )
+            parts = [
+                {"PartNumber": number, "ETag": etag}
+                for number, etag in enumerate(etags, start=1)
+            ]
+
+        response = api.post(
+            "s3/complete_multipart",
+            json={"key": key, "upload_id": upload_id, "parts": parts},
+            headers=JSON_HEADERS,
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"failed to complete upload: {response.text}")
+    except Exception as e:
+        # Don't leave orphaned parts in the bucket
+        api.post(
+            "s3/abort_multipart",
+            json={"key": key, "upload_id": upload_id},
+            headers=JSON_HEADERS,
+        )
+        return f"Multipart upload failed for {task.file_path}: {str(e)}"
+    return None
+
+
 METADATA_MAPPING = {  # keys are server keys, values are local config keys
         "description": "description",
         "leadDeveloper": "lead_developer_email",
         "gitRepository": "github_url",
     }
+_METADATA_MAPPING_ITEMS = tuple(METADATA_MAPPING.items())
 
 def upload_services_config_to_s3(
-    deployment_id, app_id, env: str, creds_path: str = None, deploy_all: bool = False
+    deployment_id,
+    app_id,
+    env: str,
+    creds_path: str = None,
+    deploy_all: bool = False,
+    config: dict = None,
+    api: APIClient = None,
+    max_workers: int = UPLOAD_MAX_WORKERS,
+    keep_going: bool = False,
 ) -> tuple[dict, list]:
+    """
+    `config` and `api` let a command that already loaded them skip doing it again.
+    `max_workers` is the number of files uploaded at once. The first failed upload
+    cancels the rest unless `keep_going` is set, which uploads every file and
+    reports all failures at the end.
+    """
     try:
-        config = load_config()
+        if config is None:
+            config = load_config()
         lifecycle_path = get_lifecycle_path()
         env_path = str(get_lifecycle_env_path(env))
         env_vars = load_env(env_path)
@@ -77,152 +503,307 @@ def upload_services_config_to_s3(
             fg=typer.colors.BRIGHT_BLUE,
         )
 
-        # Collect all upload tasks
-        upload_tasks = []
-        services_without_files = []
-        api = APIClient(
-            base_url=get_deployment_base_url(env),
-            env=env,
-            creds_path=creds_path,
+        if api is None:
+            api = get_client(
+                base_url=get_deployment_base_url(env),
+                env=env,
+                creds_path=creds_path,
+            )
+        is_excluded = _exclusion_matcher(
+            _supported_patterns(
+                (f"deploy_exclude[{index}]", pattern)
+                for index, pattern in enumerate(config.get("deploy_exclude") or ())
+            )
+            + _read_ignore_file(os.path.join(lifecycle_path, DEPLOY_IGNORE_FILE))
         )
+        s3_pool = _get_s3_pool(max_workers)
 
-        for service in services_to_deploy:
-            folder_path = config["core_services"][service]
-            key_prefix = join_s3_path("lifecycle", app_id, str(deployment_id), service)
-            service_has_files = False
-
-            for root, _, files in os.walk(folder_path):
-                for file in files:
-                    # Skip files with .example in the name
-                    if ".example" in file:
-                        continue
-                    full_path = os.path.join(root, file)
-                    if os.path.isfile(full_path):
+        # Service folders are walked on a separate thread and uploads start as files are found
+        task_queue = queue.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        stop_discovery = threading.Event()
+        services_without_files = []
+        # Size -> (path, key) of the first single-PUT file with that size; it is only hashed
+        # once another file of the same size turns up, so a run without duplicates reads nothing extra
+        first_of_size = {}
+        sources = {}  # content hash -> key of the first file with that content
+        pruned_dirs = {}  # service -> excluded folders that weren't walked
+        discovery_errors = []
+
+        def find_source(file_path, size, s3_key):
+            """Key of an earlier file with the same content as this one, or None."""
+            first = first_of_size.setdefault(size, (file_path, s3_key))
+            if first[1] == s3_key or "s3/copy_object" in _UNSUPPORTED_ENDPOINTS:
+                return None
+            if first[0] is not None:
+                first_hash = _content_hash(first[0], env_vars)
+                if first_hash:
+                    sources.setdefault(first_hash, first[1])
+                first_of_size[size] = (None, first[1])  # hashed
+            content_hash = _content_hash(file_path, env_vars)
+            if content_hash is None:
+                return None
+            source = sources.setdefault(content_hash, s3_key)
+            return None if source == s3_key else source
+
+        def discover_files():
+            try:
+                for service in services_to_deploy:
+                    folder_path = config["core_services"][service]
+                    key_prefix = join_s3_path("lifecycle", app_id, str(deployment_id), service)
+                    # Every entry path starts with this, so the relative path is a plain slice
+                    folder_len = len(os.path.join(folder_path, ""))
+                    service_has_files = False
+                    pruned = pruned_dirs[service] = []
+
+                    for entry in _iter_files(folder_path, is_excluded, pruned):
+                        if stop_discovery.is_set():
+                            return
                         service_has_files = True
-                        relative_path = os.path.relpath(full_path, folder_path)
-                        # Convert relative_path to POSIX for S3
-                        s3_key = join_s3_path(key_prefix, relative_path)
-                        upload_tasks.append(
-                            {
-                                "service": service,
-                                "file_path": full_path,
-                                "s3_key": s3_key,
-                                "folder_path": folder_path,
-                            }
+                        # Convert relative_path to POSIX for S3, as join_s3_path does
+                        relative_path = entry.path[folder_len:].replace("\\", "/")
+                        s3_key = f"{key_prefix}/{relative_path}"
+                        size = entry.stat().st_size
+                        multipart = _uses_multipart(entry.path, size)
+                        task_queue.put(
+                            UploadTask(
+                                service=service,
+                                file_path=entry.path,
+                                file_name=entry.name,
+                                size=size,
+                                s3_key=s3_key,
+                                folder_path=folder_path,
+                                multipart=multipart,
+                                direct=size < DIRECT_UPLOAD_MAX_SIZE,
+                                copy_of=(
+                                    None if multipart else find_source(entry.path, size, s3_key)
+                                ),
+                            )
                         )
 
-            # Only add service to payload if it has files to upload
-            if service_has_files:
-                services_payload[service] = {"configuration_file_path": key_prefix}
-            else:
-                services_without_files.append(service)
-
-        # Warn about services with no files
-        if services_without_files:
-            for service in services_without_files:
-                typer.secho(
-                    f"⚠️  No files detected for '{service}' (only .example files found). Skipping.",
-                    fg=typer.colors.YELLOW,
-                )
-            # Remove services without files from services_to_deploy
-            services_to_deploy = [s for s in services_to_deploy if s not in services_without_files]
-
-        # Check if any services remain
-        if not services_to_deploy:
-            typer.secho(
-                "No services with files to upload. All selected services only contain .example files.",
-                fg=typer.colors.BRIGHT_RED,
-            )
-            raise typer.Exit(1)
-
-        # Upload files concurrently
-        total_files = len(upload_tasks)
-        typer.secho(
-            f"Uploading {total_files} files across {len(services_to_deploy)} services...",
-            fg=typer.colors.MAGENTA,
-        )
-
-        upload_tasks.append(
-            {
-                "service": "lifecycle",
-                "file_path": str(get_lifecycle_config_path()),
-                "s3_key": join_s3_path(
-                    "lifecycle", app_id, str(deployment_id), CONFIG_FILE
-                ),
-                "folder_path": str(lifecycle_path),
-            }
-        )
+                    # Only add service to payload if it has files to upload
+                    if service_has_files:
+                        services_payload[service] = {"configuration_file_path": key_prefix}
+                    else:
+                        services_without_files.append(service)
+            except Exception as e:
+                discovery_errors.append(e)
+            finally:
+                task_queue.put(None)  # discovery finished
 
-        def upload_file(task):
+        def upload_file(task, presigned_url):
             try:
-                # Generate presigned URL
-                response = api.post(
-                    "s3/generate_presigned_url",
-                    json={"key": task["s3_key"]},
-                    headers={"Content-Type": "application/json"},
-                )
-                if response.status_code != 200:
-                    return f"Failed to generate presigned URL for {task['file_path']}: {response.text}"
-
-                presigned_url = response.json().get("url")
-                file_name = os.path.basename(task["file_path"])
+                if task.multipart:
+                    result = _multipart_upload(api, s3_pool, task, task.size)
+                    if result is not NotImplemented:
+                        return result
+
+                if presigned_url is None and task.direct:
+                    # No URL from the batch presign: one direct request beats presign + PUT
+                    if _is_template(task.file_path):
+                        body = inject_env_into_schema(task.file_path, env_vars)
+                    else:
+                        with open(task.file_path, "rb") as file_data:
+                            body = file_data.read()
+                    result = _direct_upload(api, task, body)
+                    if result is not NotImplemented:
+                        return result
+
+                if presigned_url is None:
+                    response = _presign(api, task.s3_key)
+                    if response.status_code != 200:
+                        return f"Failed to generate presigned URL for {task.file_path}: {response.text}"
+
+                    presigned_url = response.json().get("url")
 
                 # Upload file
-                if file_name.endswith(".json") or file_name.endswith(".yaml"):
+                if _is_template(task.file_path):
                     injected_content = inject_env_into_schema(
-                        task["file_path"], env_vars
+                        task.file_path, env_vars
                     )
-                    upload_response = requests.put(
+                    upload_response = s3_pool.request(
+                        "PUT",
                         presigned_url,
-                        data=injected_content.encode(),
-                        headers={
-                            "Content-Type": "application/octet-stream",
-                            "x-amz-server-side-encryption": "aws:kms",
-                        },
+                        body=injected_content,
+                        headers=S3_PUT_HEADERS,
                     )
                 else:
-                    with open(task["file_path"], "rb") as file_data:
-                        upload_response = requests.put(
+                    file_size = task.size
+                    with open(task.file_path, "rb") as file_data:
+                        # An explicit Content-Length keeps the upload out of chunked transfer encoding
+                        upload_response = s3_pool.request(
+                            "PUT",
                             presigned_url,
-                            data=file_data,
-                            headers={
-                                "Content-Type": "application/octet-stream",
-                                "x-amz-server-side-encryption": "aws:kms",
-                            },
+                            body=(
+                                file_data.read()
+                                if file_size < SMALL_UPLOAD_SIZE
+                                else file_data
+                            ),
+                            headers={**S3_PUT_HEADERS, "Content-Length": str(file_size)},
                         )
 
-                if upload_response.status_code != 200:
-                    return f"Upload failed for {task['file_path']}: HTTP {upload_response.status_code}"
+                if upload_response.status != 200:
+                    return f"Upload failed for {task.file_path}: HTTP {upload_response.status}"
 
                 return None  # Success
             except Exception as e:
-                return f"Error uploading {task['file_path']}: {str(e)}"
+                return f"Error uploading {task.file_path}: {str(e)}"
+
+        def copy_file(task, source_key, source_future, presigned_url):
+            # The source may still be queued. Waiting for it can't deadlock only because the
+            # pool hands out work in submission order, so the source starts before this does.
+            try:
+                if source_future.result() is None:
+                    result = _copy_object(api, source_key, task)
+                    if result is None:
+                        copied.append(task)
+                    if result is not NotImplemented:
+                        return result
+            except CancelledError:  # an earlier failure stopped the run before the source started
+                return f"Upload cancelled for {task.file_path}"
+            except Exception as e:
+                return f"Error copying {task.file_path}: {str(e)}"
+            # Counted as an upload, not a copy
+            return upload_file(task, presigned_url)
+
+        typer.secho(
+            f"Uploading files across {len(services_to_deploy)} services...",
+            fg=typer.colors.MAGENTA,
+        )
 
         # Execute uploads with progress tracking
+        results = queue.SimpleQueue()
+        submitted_count = 0
         completed_count = 0
         errors = []
+        # Key -> future of each single-PUT upload, for the copies that wait on it
+        upload_futures = {}
+        copied = []  # tasks copied server side instead of uploaded
+
+        # One live progress bar instead of a line per file; it redraws at its own pace
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeRemainingColumn(),
+            transient=True,
+        ) as progress, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The total grows as the walk finds more files
+            upload_progress = progress.add_task("Uploading", total=None)
+
+            def finish_upload(task, result):
+                if result is None:
+                    progress.advance(upload_progress)
+                results.put((task, result))
+
+            def submit_uploads(tasks):
+                nonlocal submitted_count
+                url_by_key = _presign_batch(
+                    api, [task.s3_key for task in tasks if not task.multipart]
+                )
+                for task in tasks:
+                    presigned_url = url_by_key.get(task.s3_key)
+                    # The source was queued before its duplicate, so its future already exists
+                    source_future = upload_futures.get(task.copy_of)
+                    if source_future is not None:
+                        future = executor.submit(
+                            copy_file, task, task.copy_of, source_future, presigned_url
+                        )
+                    else:
+                        future = executor.submit(upload_file, task, presigned_url)
+                        if not task.multipart:
+                            upload_futures[task.s3_key] = future
+                    future.add_done_callback(
+                        lambda f, task=task: f.cancelled() or finish_upload(task, f.result())
+                    )
+                submitted_count += len(tasks)
+                progress.update(upload_progress, total=submitted_count)
+
+            def report_results(block):
+                nonlocal completed_count
+                while completed_count < submitted_count and not stop_discovery.is_set():
+                    try:
+                        task, result = results.get(block=block)
+                    except queue.Empty:
+                        return
+                    completed_count += 1
+
+                    if result is not None:  # Error
+                        errors.append(result)
+                        typer.secho(
+                            f"✗ {task.service}/{task.file_name}",
+                            fg=typer.colors.BRIGHT_RED,
+                            err=True,
+                        )
+                        if not keep_going:
+                            # The deployment cannot succeed anymore, drop the uploads that haven't started
+                            stop_discovery.set()
+                            executor.shutdown(wait=False, cancel_futures=True)
+
+            threading.Thread(target=discover_files, daemon=True).start()
+            batch = []
+            while True:
+                task = task_queue.get()
+                if task is not None and not stop_discovery.is_set():
+                    batch.append(task)
+                # Presign whatever has been found whenever the walk gets ahead of the uploads
+                if task is None or len(batch) >= PRESIGN_BATCH_SIZE or task_queue.empty():
+                    if batch:
+                        submit_uploads(batch)
+                        batch = []
+                    report_results(block=False)
+                if task is None:
+                    break
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_task = {
-                executor.submit(upload_file, task): task for task in upload_tasks
-            }
-
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                result = future.result()
-                completed_count += 1
+            if discovery_errors:
+                raise discovery_errors[0]
 
-                if result is None:  # Success
+            for service, pruned in pruned_dirs.items():
+                if pruned:
+                    folder_len = len(os.path.join(config["core_services"][service], ""))
                     typer.secho(
-                        f"✓ [{completed_count}/{total_files}] {task['service']}/{os.path.basename(task['file_path'])}",
-                        fg=typer.colors.MAGENTA,
+                        f"Skipped excluded folders in '{service}': "
+                        + ", ".join(path[folder_len:].replace("\\", "/") for path in pruned),
+                        fg=typer.colors.BRIGHT_BLACK,
                     )
-                else:  # Error
-                    errors.append(result)
+
+            # Warn about services with no files
+            if services_without_files:
+                for service in services_without_files:
                     typer.secho(
-                        f"✗ [{completed_count}/{total_files}] {task['service']}/{os.path.basename(task['file_path'])}",
-                        fg=typer.colors.BRIGHT_RED,
+                        f"⚠️  No files to upload for '{service}' (the folder is empty or every file is excluded). Skipping.",
+                        fg=typer.colors.YELLOW,
                     )
+                # Remove services without files from services_to_deploy
+                services_to_deploy = [s for s in services_to_deploy if s not in services_without_files]
+
+            # Check if any services remain
+            if not services_to_deploy:
+                typer.secho(
+                    "No services with files to upload.",
+                    fg=typer.colors.BRIGHT_RED,
+                )
+                raise typer.Exit(1)
+
+            # A failed service upload stops the run before the lifecycle config is sent
+            report_results(block=True)
+            if not stop_discovery.is_set():
+                config_file_path = get_lifecycle_config_path()
+                submit_uploads(
+                    [
+                        UploadTask(
+                            service="lifecycle",
+                            file_path=str(config_file_path),
+                            file_name=config_file_path.name,
+                            size=config_file_path.stat().st_size,
+                            s3_key=join_s3_path(
+                                "lifecycle", app_id, str(deployment_id), CONFIG_FILE
+                            ),
+                            folder_path=str(lifecycle_path),
+                            direct=True,
+                        )
+                    ]
+                )
+            report_results(block=True)
 
         if errors:
             typer.secho("\nUpload errors:", fg=typer.colors.BRIGHT_RED)
@@ -230,8 +811,9 @@ def upload_services_config_to_s3(
                 typer.secho(f"  • {error}", fg=typer.colors.RED)
             raise typer.Exit(1)
 
+        copied_note = f" ({len(copied)} copied from identical files)" if copied else ""
         typer.secho(
-            f"✓ Successfully uploaded all {total_files} files!",
+            f"✓ Successfully uploaded all {completed_count} files{copied_note}!",
             fg=typer.colors.BRIGHT_GREEN,
         )
 
@@ -244,21 +826,21 @@ def upload_services_config_to_s3(
 
 def replace_server_metadata_keys(server_response, local_metadata_keys) -> dict:
     """This function replaces server metadata keys to match local metadata keys if they differ in naming conventions."""
-    updated_metadata = {}
-    for server_key, local_key in METADATA_MAPPING.items():
-        if local_key in local_metadata_keys and server_key in server_response:
-            updated_metadata[local_key] = server_response[server_key]
-
-    return updated_metadata
+    return {
+        local_key: server_response[server_key]
+        for server_key, local_key in _METADATA_MAPPING_ITEMS
+        if local_key in local_metadata_keys and server_key in server_response
+    }
 
 
 def get_metadata_diff(config, server_data) -> None:
     local_metadata = config.get("application", {})
     server_metadata = replace_server_metadata_keys(server_data, local_metadata.keys())
+    # Only mapped keys can differ, so compare those instead of every local field
     diff_metadata = {
-        k: v
-        for k, v in local_metadata.items()
-        if k in server_metadata and server_metadata[k] != v
+        k: local_metadata[k]
+        for k, server_value in server_metadata.items()
+        if local_metadata[k] != server_value
     }
 
     if diff_metadata:
@@ -280,6 +862,18 @@ def deploy(
         "-a",
         help="Deploy all services without prompting for selection.",
     ),
+    upload_concurrency: int = typer.Option(
+        UPLOAD_MAX_WORKERS,
+        "--upload-concurrency",
+        envvar="CXP_UPLOAD_CONCURRENCY",
+        min=1,
+        help="Number of files uploaded at once.",
+    ),
+    keep_going: bool = typer.Option(
+        False,
+        "--keep-going",
+        help="Upload the remaining files after a failed upload and report every failure.",
+    ),
 ) -> None:
     """
     Deploy your application services to the specified environment.
@@ -296,16 +890,26 @@ def deploy(
         )
         raise typer.Exit(1)
 
-    iam_api = APIClient(base_url=BASE_URL_BY_ENV[env], env=env, creds_path=creds_path)
-    lifecycle_api = APIClient(
+    iam_api = get_client(base_url=get_iam_base_url(env), env=env, creds_path=creds_path)
+    lifecycle_api = get_client(
         base_url=get_deployment_base_url(env), env=env, creds_path=creds_path
     )
 
+    # The IAM lookup and the in-progress check are independent, so send them together
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        iam_future = executor.submit(
+            iam_api.get,
+            f"/cxp-iam/api/v1/applications/{app_id}",
+            headers=JSON_HEADERS,
+        )
+        in_progress_future = executor.submit(
+            lifecycle_api.get,
+            f"/status/application/{app_id}/inProgress",
+            headers=JSON_HEADERS,
+        )
+
     # Check if application exists in IAM
-    iam_response = iam_api.get(
-        f"/cxp-iam/api/v1/applications/{app_id}",
-        headers={"Content-Type": "application/json"},
-    )
+    iam_response = iam_future.result()
     deployment_id = uuid.uuid4()
     payload = {
         "deployment_id": str(deployment_id),
@@ -322,7 +926,7 @@ def deploy(
         ds_response = lifecycle_api.post(
             f"/deployments/validate/{app_id}",
             json=payload,
-            headers={"Content-Type": "application/json"},
+            headers=JSON_HEADERS,
         )
         ds_status_code = ds_response.status_code
         if ds_status_code == 200:
@@ -341,7 +945,7 @@ def deploy(
                 )
                 raise typer.Exit(1)
         else:
-            response_json = json.loads(ds_response.text)
+            response_json = loads(ds_response.content)
             detail = response_json.get("detail", "No detail provided.")
             typer.secho(
                 f"Error validating application in Developer Studio: {detail}",
@@ -360,10 +964,7 @@ def deploy(
         )
         raise typer.Exit(1)
 
-    response = lifecycle_api.get(
-        f"/status/application/{app_id}/inProgress",
-        headers={"Content-Type": "application/json"},
-    )
+    response = in_progress_future.result()
     if response.status_code == 200:
         in_progress = response.json()
         if in_progress:
@@ -393,14 +994,22 @@ def deploy(
     )
 
     services_payload, services = upload_services_config_to_s3(
-        deployment_id, app_id, env, creds_path=creds_path, deploy_all=deploy_all
+        deployment_id,
+        app_id,
+        env,
+        creds_path=creds_path,
+        deploy_all=deploy_all,
+        config=config,
+        api=lifecycle_api,
+        max_workers=upload_concurrency,
+        keep_going=keep_going,
     )
     payload["services"] = services_payload
     typer.secho(
         f"Deploying services: {', '.join(services)}", fg=typer.colors.BRIGHT_YELLOW
     )
     response = lifecycle_api.post(
-        "/msk/deploy", json=payload, headers={"Content-Type": "application/json"}
+        "/msk/deploy", json=payload, headers=JSON_HEADERS
     )
     if response.status_code != 200:
         typer.secho(
@@ -436,7 +1045,8 @@ def get_status(
 
     # Streaming mode using SSE
     try:
-        api = APIClient(base_url=get_deployment_base_url(env), env=env)
+        base_url = get_deployment_base_url(env)
+        api = get_client(base_url=base_url, env=env)
 
         typer.secho(
             f"Streaming deployment status for ID: {deployment_id} (Ctrl+C to exit)",
@@ -445,17 +1055,13 @@ def get_status(
         typer.secho("=" * 50, fg=typer.colors.BRIGHT_BLUE)
 
         # Connect to SSE endpoint
-        stream_url = (
-            f"{get_deployment_base_url(env)}/status/deployment/stream/{deployment_id}"
-        )
-        headers = api.get_headers()
-
-        for event in SSEClient(stream_url, headers=headers):
-            if not event.data:
+        stream_url = f"{base_url}/status/deployment/stream/{deployment_id}"
+        for data in stream_event_data(api.session, stream_url):
+            if not data:
                 continue
 
             try:
-                status_data = json.loads(event.data)
+                status_data = loads(data)
 
                 if "info" in status_data and "Connection closed" in status_data["info"]:
                     typer.secho(
@@ -474,8 +1080,8 @@ def get_status(
                     )
                     break
 
-                # Clear screen for better visibility
-                os.system("cls" if os.name == "nt" else "clear")
+                # Clear screen for better visibility (ANSI home + erase, no `clear` subprocess)
+                typer.echo(CLEAR_SCREEN, nl=False)
                 typer.secho(
                     f"Deployment ID: {deployment_id} (Environment: {env})",
                     fg=typer.colors.BRIGHT_BLUE,
@@ -524,16 +1130,10 @@ def get_status(
 
             except json.JSONDecodeError:
                 typer.secho(
-                    f"Error parsing status update: {event.data}",
+                    f"Error parsing status update: {data.decode(errors='replace')}",
                     fg=typer.colors.BRIGHT_RED,
                 )
 
-    except ImportError:
-        typer.secho(
-            "SSE client library not found. Install with: pip install sseclient-py",
-            fg=typer.colors.BRIGHT_RED,
-        )
-        return
     except KeyboardInterrupt:
         typer.secho(
             "\nStopped watching deployment status.", fg=typer.colors.BRIGHT_BLUE
@@ -546,7 +1146,7 @@ def get_status(
 
 def _display_deployment_status(deployment_id: str, env: str) -> None:
     """Display deployment status"""
-    api = APIClient(base_url=get_deployment_base_url(env), env=env)
+    api = get_client(base_url=get_deployment_base_url(env), env=env)
     response = api.get(f"/status/deployment/get/{deployment_id}")
 
     if response.status_code != 200:
@@ -1,33 +1,41 @@
+import functools
 import json
 from typing import Optional
 
 import typer
 
-from cli.helpers.api_client import APIClient
+from cli.helpers.api_client import get_client
 from cli.config import get_deployment_base_url, ENVIRONMENTS
 from cli.helpers.file import load_config
 from cli.helpers.errors import handle_env_error
+from cli.helpers.table import fit_to_terminal, truncate
 
 
 deployments_app = typer.Typer(help="View deployment details and history.")
 
+# Deployment ID, Status, Version, Deployed By, Deployment Time
+HISTORY_MAX_WIDTHS = (36, 24, 16, 40, 24)
 
-def _colorize_status(status: Optional[str]) -> str:
+
+_STATUS_COLOR = {
+    "validation in progress": typer.colors.CYAN,
+    "deployment in progress": typer.colors.CYAN,
+    "deployed": typer.colors.GREEN,
+    "deployment failed": typer.colors.RED,
+    "partially successful": typer.colors.YELLOW,
+    "deployment canceled": typer.colors.MAGENTA,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _colorize_status(status: Optional[str], shown: Optional[str] = None) -> str:
+    """`shown` is the (possibly truncated) text to display; the color comes from `status`."""
     if not status:
         return "-"
     raw = str(status)
-    s = raw.strip().lower()
-    if s in {"validation in progress", "deployment in progress"}:
-        return typer.style(raw, fg=typer.colors.CYAN)
-    if s == "deployed":
-        return typer.style(raw, fg=typer.colors.GREEN)
-    if s == "deployment failed":
-        return typer.style(raw, fg=typer.colors.RED)
-    if s == "partially successful":
-        return typer.style(raw, fg=typer.colors.YELLOW)
-    if s == "deployment canceled":
-        return typer.style(raw, fg=typer.colors.MAGENTA)
-    return raw
+    text = raw if shown is None else shown
+    color = _STATUS_COLOR.get(raw.strip().lower())
+    return typer.style(text, fg=color) if color else text
 
 
 def _format_nullable(value):
@@ -105,7 +113,7 @@ def get_deployment(
         deployment_id = None
 
     handle_env_error(env)
-    api = APIClient(
+    api = get_client(
         base_url=get_deployment_base_url(env), env=env, creds_path=creds_path
     )
 
@@ -187,7 +195,7 @@ def list_deployments_history(
             fg=typer.colors.RED,
         )
         raise typer.Exit(1)
-    api = APIClient(
+    api = get_client(
         base_url=get_deployment_base_url(env), env=env, creds_path=creds_path
     )
     resp = api.get(f"/cli/deployments/history/{app_id}")
@@ -241,22 +249,29 @@ def list_deployments_history(
     for row in rows:
         for i, cell in enumerate(row):
             col_widths[i] = max(col_widths[i], len(str(cell)))
+    # One oversized value shouldn't widen the whole column; cap it and truncate the cell
+    col_widths = fit_to_terminal(
+        [min(width, HISTORY_MAX_WIDTHS[i]) for i, width in enumerate(col_widths)], 3
+    )
 
     typer.echo("")
 
-    header_line = "   ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
+    header_line = "   ".join(
+        truncate(h, col_widths[i]).ljust(col_widths[i]) for i, h in enumerate(headers)
+    )
     separator = "   ".join("-" * col_widths[i] for i in range(len(headers)))
     typer.secho(header_line, fg=typer.colors.BRIGHT_BLUE)
     typer.secho(separator, fg=typer.colors.BLUE)
 
     for row in rows:
-        dep_cell = str(row[0]).ljust(col_widths[0])
-        raw_status = str(row[1])
-        colored_status = _colorize_status(raw_status)
+        cells = [truncate(str(cell), col_widths[i]) for i, cell in enumerate(row)]
+        dep_cell = cells[0].ljust(col_widths[0])
+        raw_status = cells[1]
+        colored_status = _colorize_status(str(row[1]), raw_status)
         status_cell = _pad_styled(raw_status, col_widths[1], colored_status)
-        version_cell = str(row[2]).ljust(col_widths[2])
-        by_cell = str(row[3]).ljust(col_widths[3])
-        time_cell = str(row[4]).ljust(col_widths[4])
+        version_cell = cells[2].ljust(col_widths[2])
+        by_cell = cells[3].ljust(col_widths[3])
+        time_cell = cells[4].ljust(col_widths[4])
         typer.echo(
             "   ".join([dep_cell, status_cell, version_cell, by_cell, time_cell])
         )
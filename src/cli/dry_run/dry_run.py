@@ -2,31 +2,19 @@ import typer
 import uuid
 import json
 from cli.config import get_deployment_base_url
-from cli.helpers.api_client import APIClient
+from cli.helpers.api_client import APIClient, get_client
 from cli.helpers.file import load_config
 from cli.helpers.errors import handle_env_error
+from cli.helpers.json_io import loads
+from cli.helpers.sse import stream_event_data
 from cli.helpers.status import get_status_color
 from cli.deploy.deploy import upload_services_config_to_s3
 
-try:
-    from sseclient import SSEClient
-
-    HAS_SSE = True
-except ImportError:
-    HAS_SSE = False
-
 
 def _stream_dry_run_status(
     validation_id: str, env: str, api: APIClient, services: list
 ) -> dict:
     """Stream validation status using SSE until completion or failure"""
-    if not HAS_SSE:
-        typer.secho(
-            "SSE streaming not available.",
-            fg=typer.colors.BRIGHT_YELLOW,
-        )
-        return None
-
     try:
         typer.secho(
             f"\nWaiting for dry-run validation to complete...",
@@ -36,17 +24,15 @@ def _stream_dry_run_status(
         stream_url = (
             f"{get_deployment_base_url(env)}/status/deployment/stream/{validation_id}"
         )
-        headers = api.get_headers()
-
         completed_services = set()
         last_status = None
 
-        for event in SSEClient(stream_url, headers=headers):
-            if not event.data:
+        for data in stream_event_data(api.session, stream_url):
+            if not data:
                 continue
 
             try:
-                status_data = json.loads(event.data)
+                status_data = loads(data)
 
                 if "info" in status_data and "Connection closed" in status_data["info"]:
                     typer.secho(
@@ -115,7 +101,7 @@ def _stream_dry_run_status(
 
             except json.JSONDecodeError:
                 typer.secho(
-                    f"\nError parsing status update: {event.data}",
+                    f"\nError parsing status update: {data.decode(errors='replace')}",
                     fg=typer.colors.BRIGHT_RED,
                 )
                 continue
@@ -230,8 +216,18 @@ def dry_run(
         fg=typer.colors.BRIGHT_BLUE,
     )
 
+    api = get_client(
+        base_url=get_deployment_base_url(env), env=env, creds_path=creds_path
+    )
+
     services_payload, services = upload_services_config_to_s3(
-        deployment_id, app_id, env, creds_path=creds_path, deploy_all=validate_all
+        deployment_id,
+        app_id,
+        env,
+        creds_path=creds_path,
+        deploy_all=validate_all,
+        config=config,
+        api=api,
     )
 
     payload = {
@@ -251,10 +247,6 @@ def dry_run(
         f"Dry-run services: {', '.join(services)}", fg=typer.colors.BRIGHT_YELLOW
     )
 
-    api = APIClient(
-        base_url=get_deployment_base_url(env), env=env, creds_path=creds_path
-    )
-
     response = api.post(
         "/dry-run", json=payload, headers={"Content-Type": "application/json"}
     )
@@ -1,9 +1,44 @@
-import requests
+import functools
+
 from cli.settings import general_config
 from cli.config import BACKEND_BASE_URL, ENV
 from cli.validators import validate_creds
 
 
+@functools.lru_cache(maxsize=None)
+def _get_session(service_credentials: str):
+    """
+    Session shared by every APIClient with the same credentials, so clients for
+    different backends (IAM, deployments, ...) share one keep-alive pool manager.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # One pool per backend host, each sized for the deploy upload workers.
+    # Retry only covers idempotent methods (GET, PUT, DELETE, ...), never POST.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "X-ServiceCredentials": service_credentials,
+            "Content-Type": "application/json",
+        }
+    )
+    return session
+
+
 class APIClient:
     def __init__(self, base_url: str = None, env: str = None, creds_path: str = None):
         self.base_url = base_url if base_url else BACKEND_BASE_URL
@@ -14,13 +49,7 @@ class APIClient:
         self.service_credentials = (
             general_config.cx_cli_service_accounts_credentials.get(self.env, "")
         )
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "X-ServiceCredentials": self.service_credentials,
-                "Content-Type": "application/json",
-            }
-        )
+        self.session = _get_session(self.service_credentials)
 
     def _build_url(self, endpoint: str) -> str:
         return f"{self.base_url}/{endpoint.lstrip('/')}"
@@ -41,3 +70,11 @@ class APIClient:
 
     def get_headers(self):
         return dict(self.session.headers)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(
+    base_url: str = None, env: str = None, creds_path: str = None
+) -> APIClient:
+    """Return a shared APIClient per (base_url, env, creds_path) so its session is reused."""
+    return APIClient(base_url=base_url, env=env, creds_path=creds_path)
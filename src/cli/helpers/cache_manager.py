@@ -1,18 +1,30 @@
-import json
+import atexit
+import functools
 import os
 import re
 import shutil
 import subprocess
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import timedelta
 from importlib.metadata import version as dist_version
 from pathlib import Path
 from typing import Optional, Tuple
 
-import requests
-from packaging.version import Version
+from cli.helpers.json_io import dumps, loads
+from cli.helpers.path_utils import get_version_cache_path
 
-CACHE_FILE = Path("lifecycle", ".version_cache.json")
-CACHE_TTL = timedelta(hours=24)
+CACHE_FILE = get_version_cache_path()
+CACHE_TTL = timedelta(hours=6)
+GITHUB_TAGS_URL = "https://api.github.com/repos/CXEPI/cxp-lifecycle-cli/tags"
+GITHUB_TIMEOUT = 1  # seconds
+_V_PREFIX = re.compile(r"^[vV]")
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_version(package_name: str) -> str:
+    """Resolve the installed distribution version once per process."""
+    return dist_version(package_name)
 
 
 class VersionManager:
@@ -29,30 +41,47 @@ class VersionManager:
         self.installed_version = self.get_project_version()
 
     def get_latest_version(self) -> str:
-        cached = self.get_cache_version()
+        cached, is_fresh = self.get_cache_version()
         if cached:
+            if not is_fresh:
+                # Serve the stale value right away and refresh the cache in the background.
+                # Daemon threads die at exit, so give the refresh up to the lookup timeout to
+                # finish then; otherwise short commands would never update the cache.
+                refresh = threading.Thread(target=self._refresh, daemon=True)
+                refresh.start()
+                atexit.register(refresh.join, GITHUB_TIMEOUT)
             return cached
 
-        tag = self.get_latest_github_tag()
-        latest = tag if tag else self.get_project_version()
-
-        self.save_cache_version(latest)
+        latest = self._refresh()
+        if not latest:
+            latest = self.get_project_version()
+            self.save_cache_version(latest)
         return latest
 
+    def _refresh(self) -> Optional[str]:
+        """Fetch the latest tag and cache it. A failed lookup leaves the cache untouched."""
+        tag = self.get_latest_github_tag()
+        if tag:
+            self.save_cache_version(tag)
+        return tag
+
     def save_cache_version(self, version: str) -> None:
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, "w") as f:
-                json.dump(
-                    {"version": version, "timestamp": datetime.now().isoformat()},
-                    f,
-                )
+            # Write a sibling file and swap it in so a concurrent reader never sees a partial file
+            tmp_file = self.cache_file.with_name(
+                f"{self.cache_file.name}.{os.getpid()}.tmp"
+            )
+            tmp_file.write_bytes(dumps({"version": version, "epoch": int(time.time())}))
+            os.replace(tmp_file, self.cache_file)
         except Exception:
             pass
 
     def get_latest_github_tag(self) -> Optional[str]:
         try:
-            url = "https://api.github.com/repos/CXEPI/cxp-lifecycle-cli/tags"
+            import urllib.request
+            from packaging.version import Version
+
             headers = {
                 "Accept": "application/vnd.github+json",
                 "User-Agent": "cxp-lifecycle-cli/version-check",
@@ -61,11 +90,10 @@ class VersionManager:
             if token:
                 headers["Authorization"] = f"Bearer {token}"
 
-            resp = requests.get(url, headers=headers, timeout=3)
-            if resp.status_code != 200:
-                return None
-
-            tags = resp.json()
+            # urlopen raises for non-2xx responses, which the except below turns into None
+            request = urllib.request.Request(GITHUB_TAGS_URL, headers=headers)
+            with urllib.request.urlopen(request, timeout=GITHUB_TIMEOUT) as resp:
+                tags = loads(resp.read())
             if not isinstance(tags, list) or not tags:
                 return None
 
@@ -84,33 +112,31 @@ class VersionManager:
         except Exception:
             return None
 
-    def get_cache_version(self) -> Optional[str]:
+    def get_cache_version(self) -> Tuple[Optional[str], bool]:
+        """Return the cached version (if any) and whether it is still within the TTL."""
         try:
-            if not self.cache_file.exists():
-                return None
-            with open(self.cache_file, "r") as f:
-                data = json.load(f)
-            ts = datetime.fromisoformat(data.get("timestamp", "1970-01-01T00:00:00"))
-            if datetime.now() - ts < self.cache_ttl:
-                ver = data.get("version")
-                return ver if ver else None
+            data = loads(self.cache_file.read_bytes())
+            # Entries written before the epoch field existed count as stale
+            age = time.time() - data.get("epoch", 0)
+            ver = data.get("version")
+            return (ver if ver else None), age < self.cache_ttl.total_seconds()
         except Exception:
             # ignore cache issues silently
-            return None
-        return None
+            return None, False
 
     def get_project_version(self) -> str:
-        return dist_version(self.package_name)
+        return _installed_version(self.package_name)
 
     def is_up_to_date(self) -> bool:
-        latest = re.sub(r"^[vV]", "", self.latest_version)
-        installed = re.sub(r"^[vV]", "", self.installed_version)
+        from packaging.version import Version
 
-        return Version(installed) >= Version(latest)
+        return Version(self._strip_v(self.installed_version)) >= Version(
+            self._strip_v(self.latest_version)
+        )
 
     def _strip_v(self, version: str) -> str:
         """Remove leading 'v' or 'V' from version string"""
-        return re.sub(r"^[vV]", "", version)
+        return _V_PREFIX.sub("", version)
 
     def _safe_version(self, version: str) -> str:
         """
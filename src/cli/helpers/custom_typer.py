@@ -1,7 +1,10 @@
 import importlib
+import os
 from pathlib import Path
+from typing import Dict, Iterator, Tuple
 
 import typer
+from typer.core import TyperGroup
 
 
 class CustomTyper(typer.Typer):
@@ -23,8 +26,77 @@ class CustomTyper(typer.Typer):
         auto_help_callback.__doc__ = help_text
 
 
-def find_and_add_typer_apps(app: typer.Typer):
-    """Find and add all Typer apps from the cli package"""
+class LazyTyperGroup(TyperGroup):
+    """
+    A TyperGroup that imports subcommand modules only when they are needed.
+
+    Subclasses list top-level commands in `lazy_commands` and sub-apps in
+    `lazy_subapps`, both as ``{name: "module:attribute"}``; a lazy command may
+    point at a command function or a Typer app. When `lazy_subapps` is empty,
+    or CX_CLI_DEV=1 is set, sub-apps are found with `iter_typer_apps` instead,
+    the first time a command isn't among the known ones or the full command
+    list is needed (e.g. for --help).
+    """
+
+    lazy_commands: Dict[str, str] = {}
+    lazy_subapps: Dict[str, str] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._discovered = False
+        # In dev mode the generated registry may be stale, so scan the package instead
+        self._subapps = {} if os.environ.get("CX_CLI_DEV") == "1" else self.lazy_subapps
+
+    def _discover(self) -> None:
+        if self._discovered or self._subapps:
+            return
+        self._discovered = True
+        for name, sub_app in iter_typer_apps():
+            if name not in self.commands and name not in self.lazy_commands:
+                self.add_command(_as_click_command(name, sub_app), name)
+
+    def _load_lazy(self, name: str, target_path: str):
+        module_name, attr_name = target_path.split(":")
+        target = getattr(importlib.import_module(module_name), attr_name)
+        command = _as_click_command(name, target)
+        self.add_command(command, name)
+        return command
+
+    def list_commands(self, ctx) -> list:
+        self._discover()
+        # Same order Typer would use: plain commands first, then groups
+        names = [n for n in super().list_commands(ctx) if n not in self.lazy_commands]
+        commands = [n for n in names if not isinstance(self.commands[n], TyperGroup)]
+        groups = [n for n in names if isinstance(self.commands[n], TyperGroup)]
+        groups += [n for n in self._subapps if n not in self.commands]
+        return commands + list(self.lazy_commands) + groups
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        if cmd_name in self.lazy_commands:
+            return self._load_lazy(cmd_name, self.lazy_commands[cmd_name])
+        if cmd_name in self._subapps:
+            return self._load_lazy(cmd_name, self._subapps[cmd_name])
+        self._discover()
+        return super().get_command(ctx, cmd_name)
+
+
+def _as_click_command(name: str, target):
+    """Build the click command Typer would create for `app.command()` / `app.add_typer()`."""
+    parent = typer.Typer()
+    if isinstance(target, typer.Typer):
+        parent.add_typer(target, name=name)
+    else:
+        parent.command(name=name)(target)
+    # A second placeholder keeps Typer from collapsing the parent into the single command
+    parent.command(name="_placeholder")(lambda: None)
+    return typer.main.get_command(parent).commands[name]
+
+
+def iter_typer_apps() -> Iterator[Tuple[str, typer.Typer]]:
+    """Yield (command name, Typer app) for every sub-app module in the cli package"""
     # Get the directory where this commands.py file is located (the cli package)
     cli_package_dir = Path(__file__).parent.parent
 
@@ -52,11 +124,16 @@ def find_and_add_typer_apps(app: typer.Typer):
                 if attr_name.endswith("_app"):
                     attr = getattr(module, attr_name)
                     if isinstance(attr, typer.Typer):
-                        command_name = py_file.stem
-                        app.add_typer(attr, name=command_name)
+                        yield py_file.stem, attr
                         break  # Only add one app per module
 
         except ImportError as e:
             print(f"Could not import module for {py_file}: {e}")
         except Exception as e:
             print(f"Error processing {py_file}: {e}")
+
+
+def find_and_add_typer_apps(app: typer.Typer):
+    """Find and add all Typer apps from the cli package"""
+    for command_name, sub_app in iter_typer_apps():
+        app.add_typer(sub_app, name=command_name)
@@ -1,5 +1,5 @@
 import typer
-from cli.config import ENVIRONMENTS
+from cli.config import ENVIRONMENTS, ENVIRONMENT_NAMES
 
 
 def handle_request_error(error):
@@ -21,7 +21,7 @@ def handle_request_error(error):
 def handle_env_error(env: str):
     if env not in ENVIRONMENTS:
         typer.secho(
-            f"Error: env must be one of: {', '.join(ENVIRONMENTS)}",
+            f"Error: env must be one of: {', '.join(ENVIRONMENT_NAMES)}",
             fg=typer.colors.RED,
             bold=True,
         )
@@ -1,25 +1,47 @@
+import copy
+import functools
 import re
 import json
+import os
+import stat
 import yaml
 
 from cli.config import CONFIG_FILE
+from cli.helpers.json_io import loads
+from cli.helpers.yaml_io import Loader, Dumper
 from cli.helpers.path_utils import get_lifecycle_config_path
 import typer
 
 config_path = get_lifecycle_config_path()
+ENV_PLACEHOLDER = re.compile(r"\$\{LC\.([A-Za-z0-9_]+)\}")  # ${LC.VAR_NAME}
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_config(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime/size are part of the cache key so an edited file is parsed again
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=Loader)
 
 
 def load_config() -> dict:
-    if not config_path.is_file():
+    try:
+        st = config_path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         typer.secho(f"Config file not found: {CONFIG_FILE}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
-    with config_path.open("r") as f:
-        return yaml.safe_load(f)
+    # Callers mutate the config, so hand out a copy of the cached parse
+    return copy.deepcopy(_parse_config(str(config_path), st.st_mtime_ns, st.st_size))
+
+
+load_config.cache_clear = _parse_config.cache_clear
 
 
 def save_config(config: dict):
     with config_path.open("w") as f:
-        yaml.safe_dump(config, f, sort_keys=False)
+        yaml.dump(config, f, Dumper=Dumper, sort_keys=False)
+    _parse_config.cache_clear()
 
 
 def load_env(env_path: str) -> dict:
@@ -35,13 +57,35 @@ def load_env(env_path: str) -> dict:
     return env_vars
 
 
-def inject_env_into_schema(schema_path: str, env_vars: dict) -> str:
-    """Inject environment variables into all string values in a JSON schema file and return the modified content as a string."""
-    with open(schema_path, "r") as f:
+def inject_env_into_schema(schema_path: str, env_vars: dict) -> bytes:
+    """Inject environment variables into all string values in a JSON schema file and return the modified content as UTF-8 bytes."""
+    st = os.stat(schema_path)
+    return _render_schema(
+        schema_path, st.st_mtime_ns, st.st_size, frozenset(env_vars.items())
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _render_schema(
+    schema_path: str, mtime_ns: int, size: int, env_items: frozenset
+) -> bytes:
+    # mtime/size are part of the cache key so an edited file is rendered again
+    env_vars = dict(env_items)
+    with open(schema_path, "rb") as f:
         if schema_path.endswith(".yaml") or schema_path.endswith(".yml"):
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=Loader)
         elif schema_path.endswith(".json"):
-            data = json.load(f)
+            data = loads(f.read())
+
+    # Replace ${LC.VAR_NAME} with env_vars[VAR_NAME]
+    def replacer(match):
+        var_name = match.group(1)
+        if var_name in env_vars:
+            return env_vars[var_name]
+        else:
+            raise ValueError(
+                f"Environment variable '{var_name}' is not defined in the environment file"
+            )
 
     def replace_in_obj(obj):
         if isinstance(obj, dict):
@@ -49,23 +93,18 @@ def inject_env_into_schema(schema_path: str, env_vars: dict) -> str:
         elif isinstance(obj, list):
             return [replace_in_obj(item) for item in obj]
         elif isinstance(obj, str):
-            # Replace ${LC.VAR_NAME} with env_vars[VAR_NAME]
-            def replacer(match):
-                var_name = match.group(1)
-                if var_name in env_vars:
-                    return env_vars[var_name]
-                else:
-                    raise ValueError(
-                        f"Environment variable '{var_name}' is not defined in the environment file"
-                    )
-
-            return re.sub(r"\$\{LC\.([A-Za-z0-9_]+)\}", replacer, obj)
+            # Most strings have no placeholder; the substring check is cheaper than the regex
+            return ENV_PLACEHOLDER.sub(replacer, obj) if "${LC." in obj else obj
         else:
             return obj
 
     injected_data = replace_in_obj(data)
     if schema_path.endswith(".json"):
-        return json.dumps(injected_data, indent=2)
+        # ensure_ascii output, so the encode is a plain copy
+        return json.dumps(injected_data, indent=2).encode("ascii")
     elif schema_path.endswith(".yaml"):
-        return yaml.dump(injected_data, sort_keys=False)
-    return ""
+        # Let the emitter encode while writing instead of building a str first
+        return yaml.dump(
+            injected_data, Dumper=Dumper, sort_keys=False, encoding="utf-8"
+        )
+    return b""
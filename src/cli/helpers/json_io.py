@@ -0,0 +1,38 @@
+"""
+JSON serializer selection for cx-cli.
+
+Prefers orjson when it is installed and falls back to the stdlib json module.
+Both backends work in bytes so callers can use Path.read_bytes/write_bytes.
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+    HAS_ORJSON = False
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str; invalid input raises json.JSONDecodeError (or a subclass)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes, compact unless indent is set (2 spaces)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+logger.debug("orjson %s", "available" if HAS_ORJSON else "not available")
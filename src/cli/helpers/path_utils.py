@@ -56,6 +56,21 @@ def get_config_path() -> Path:
     return get_cx_cli_home() / "config.json"
 
 
+def get_version_cache_path() -> Path:
+    """
+    Get the path of the cached latest CLI version.
+
+    Returns:
+        Path object pointing to ~/.cx-cli/version_cache.json
+
+    Examples:
+        >>> path = get_version_cache_path()
+        >>> # Windows: C:\\Users\\username\\.cx-cli\\version_cache.json
+        >>> # macOS/Linux: /Users/username/.cx-cli/version_cache.json
+    """
+    return get_cx_cli_home() / "version_cache.json"
+
+
 def get_lifecycle_path() -> Path:
     """
     Get the lifecycle directory path in current working directory.
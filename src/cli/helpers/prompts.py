@@ -1,17 +1,19 @@
+import functools
 from typing import Callable
-from questionary import Style
-import questionary
 import typer
 import re
 from urllib.parse import urlparse
 import semver
 
+EMAIL_PATTERN = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+ALLOWED_GIT_HOSTS = frozenset({"github.com", "wwwin-github.cisco.com"})
+_ANCHORED_ALTERNATION = re.compile(r"\^\((.*?)\)\$")
+
 
 def prompt_email(prompt_text: str = "Enter lead developer email") -> str:
-    email_pattern = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
     while True:
         email = typer.prompt(prompt_text)
-        if email_pattern.match(email):
+        if EMAIL_PATTERN.match(email):
             return email
         else:
             typer.secho(
@@ -22,13 +24,12 @@ def prompt_email(prompt_text: str = "Enter lead developer email") -> str:
 
 
 def prompt_url(prompt_text: str = "Enter GitHub URL") -> str:
-    allowed_hosts = {"github.com", "wwwin-github.cisco.com"}
     while True:
         url = typer.prompt(prompt_text)
         parsed = urlparse(url)
         if (
             parsed.scheme == "https"
-            and parsed.netloc in allowed_hosts
+            and parsed.netloc in ALLOWED_GIT_HOSTS
             and parsed.path != ""
         ):
             return url
@@ -54,6 +55,22 @@ def prompt_semver_version(prompt_text: str = "Enter version (semver)") -> str:
             )
 
 
+@functools.lru_cache(maxsize=1)
+def _service_selection_style():
+    from questionary import Style
+
+    return Style(
+        [
+            ("checkbox-selected", "fg:#00aa00 bold"),  # Green checkmark
+            ("checkbox", "fg:#ffffff"),  # White for unselected
+            ("selected", "bg: fg:"),  # Transparent background
+            ("pointer", "fg:#00aa00 bold"),  # Green pointer
+            ("highlighted", "fg:#00aa00 bg:"),  # Green text, transparent background
+            ("answer", "fg:#00aa00 bold"),  # Green for final answer
+        ]
+    )
+
+
 FORMAT_PROMPT_MAP: dict[str, Callable[[str], str]] = {
     "email": prompt_email,
     "semver": prompt_semver_version,
@@ -74,11 +91,13 @@ def prompt_core_services(schema: dict) -> list[str]:
     services_raw = list(pattern_properties.keys())
 
     if services_raw and services_raw[0].startswith("^("):
-        match = re.match(r"\^\((.*?)\)\$", services_raw[0])
+        match = _ANCHORED_ALTERNATION.match(services_raw[0])
         services_clean = match.group(1).split("|") if match else []
     else:
         services_clean = [s.strip("^$") for s in services_raw]
 
+    import questionary
+
     selected_services = questionary.checkbox(
         "Select core services:", choices=services_clean
     ).ask()
@@ -112,23 +131,15 @@ def prompt_service_selection(
     if not services:
         return []
 
+    # questionary is slow to import and only needed when a prompt is shown
+    import questionary
+
     choices = [
         questionary.Choice(service, checked=all_selected) for service in services
     ]
 
-    custom_style = Style(
-        [
-            ("checkbox-selected", "fg:#00aa00 bold"),  # Green checkmark
-            ("checkbox", "fg:#ffffff"),  # White for unselected
-            ("selected", "bg: fg:"),  # Transparent background
-            ("pointer", "fg:#00aa00 bold"),  # Green pointer
-            ("highlighted", "fg:#00aa00 bg:"),  # Green text, transparent background
-            ("answer", "fg:#00aa00 bold"),  # Green for final answer
-        ]
-    )
-
     selected_services = questionary.checkbox(
-        prompt_text, choices=choices, style=custom_style
+        prompt_text, choices=choices, style=_service_selection_style()
     ).ask()
 
     return selected_services
@@ -0,0 +1,50 @@
+"""
+Server-Sent Events reader for the deployment status streams.
+
+Splits the stream into events directly on the response bytes, so each event's
+data can go straight to json_io.loads without a str round trip.
+"""
+
+import time
+from typing import Iterator
+
+RECONNECT_DELAY = 3  # seconds; the EventSource default
+
+
+def iter_event_data(response) -> Iterator[bytes]:
+    """Yield the data of each event in an open text/event-stream response."""
+    buffer = b""
+    data_lines = []
+    # chunk_size=None hands over data as it arrives instead of waiting for a full block
+    for chunk in response.iter_content(chunk_size=None):
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if not line:
+                # A blank line ends the event
+                if data_lines:
+                    yield b"\n".join(data_lines)
+                    data_lines = []
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                data_lines.append(value[1:] if value.startswith(b" ") else value)
+            # Comments (":") and the id/event/retry fields aren't used by the status streams
+
+
+def stream_event_data(session, url: str) -> Iterator[bytes]:
+    """
+    Yield the data of each event sent to url, reconnecting when the connection drops
+    like an EventSource does. HTTP errors are raised; stop iterating to disconnect.
+    """
+    import requests
+
+    headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+    while True:
+        try:
+            with session.get(url, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                yield from iter_event_data(response)
+        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+            pass
+        time.sleep(RECONNECT_DELAY)
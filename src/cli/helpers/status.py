@@ -1,24 +1,21 @@
+import functools
+
 import typer
 
+# Checked in order; the first rule with a needle found in the status wins
+_STATUS_RULES = (
+    (("Done", "Succeeded", "Completed"), typer.colors.BRIGHT_GREEN),
+    (("Failed", "REJECTED", "ERROR"), typer.colors.BRIGHT_RED),
+    (("Progress", "Pending", "RECEIVED", "Validating"), typer.colors.BRIGHT_YELLOW),
+    (("Cancel",), typer.colors.BRIGHT_MAGENTA),
+)
+
 
+@functools.lru_cache(maxsize=64)
 def get_status_color(status: str) -> str:
     """Get the appropriate color for a deployment/validation status"""
-    if not status:
-        return typer.colors.BRIGHT_CYAN
-
-    if "Done" in status or "Succeeded" in status or "Completed" in status:
-        return typer.colors.BRIGHT_GREEN
-    elif "Failed" in status or "REJECTED" in status or "ERROR" in status:
-        return typer.colors.BRIGHT_RED
-    elif (
-        "Progress" in status
-        or "Pending" in status
-        or "RECEIVED" in status
-        or "Validating" in status
-    ):
-        return typer.colors.BRIGHT_YELLOW
-    elif "Cancel" in status:
-        return typer.colors.BRIGHT_MAGENTA
-    else:
-        return typer.colors.BRIGHT_CYAN
-
+    if status:
+        for needles, color in _STATUS_RULES:
+            if any(needle in status for needle in needles):
+                return color
+    return typer.colors.BRIGHT_CYAN
@@ -0,0 +1,32 @@
+"""
+Column sizing helpers for the plain-text tables printed by cx-cli.
+"""
+
+import shutil
+import sys
+from typing import Sequence, Tuple
+
+MIN_COLUMN_WIDTH = 6
+
+
+def truncate(text: str, width: int) -> str:
+    """Cut text to width, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def fit_to_terminal(widths: Sequence[int], gap: int) -> Tuple[int, ...]:
+    """
+    Shrink column widths proportionally so a row fits the terminal.
+
+    Widths are returned unchanged when stdout is not a terminal, so piped
+    output keeps its full columns.
+    """
+    widths = tuple(widths)
+    if not sys.stdout.isatty():
+        return widths
+    spacing = gap * (len(widths) - 1)
+    available = shutil.get_terminal_size().columns - spacing
+    if sum(widths) <= available:
+        return widths
+    scale = available / sum(widths)
+    return tuple(max(MIN_COLUMN_WIDTH, int(width * scale)) for width in widths)
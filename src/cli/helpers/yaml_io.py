@@ -0,0 +1,33 @@
+"""
+YAML loader/dumper selection for cx-cli.
+
+Prefers the libyaml C bindings (CSafeLoader/CSafeDumper) and falls back to
+the pure-Python safe implementations when PyYAML was built without libyaml.
+"""
+
+import logging
+import os
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+HAS_LIBYAML = Loader is not yaml.SafeLoader
+
+logger.debug(
+    "libyaml %s; using %s/%s",
+    "available" if HAS_LIBYAML else "not available",
+    Loader.__name__,
+    Dumper.__name__,
+)
+
+
+def dump_atomic(data, path) -> None:
+    """Write data as YAML to path via a temporary file and os.replace."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        yaml.dump(data, f, Dumper=Dumper, sort_keys=False)
+    os.replace(tmp_path, path)
@@ -8,6 +8,7 @@ from cli.helpers.api_client import APIClient
 from cli.helpers.file import save_config, load_config
 from cli.helpers.prompts import prompt_application, prompt_core_services
 from cli.helpers.path_utils import get_lifecycle_path, to_posix_path
+from cli.helpers.yaml_io import Dumper
 
 
 def create_lifecycle_folder():
@@ -109,7 +110,7 @@ def _create_data_fabric_service_folder(service_path, service, api, update_only:
                 if isinstance(example_instance, str):
                     example_file.write(example_instance)
                 else:
-                    yaml.dump(example_instance, example_file, sort_keys=False)
+                    yaml.dump(example_instance, example_file, Dumper=Dumper, sort_keys=False)
             else:
                 example_file.write(json.dumps(example_instance, indent=2))
         updated_files.append(str(example_instance_path))
@@ -1,4 +1,5 @@
 import base64
+import functools
 import typer
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import requests
@@ -11,12 +12,13 @@ from tenacity import (
 )
 from cli.config import (
     CONFIG_FILE,
-    BASE_URL_BY_ENV,
-    ENVIRONMENTS,
+    ENVIRONMENT_NAMES,
+    get_iam_base_url,
 )
 from cli.helpers.api_client import APIClient
 from cli.helpers.errors import handle_request_error, handle_env_error
 from cli.helpers.file import load_config, save_config
+from cli.helpers.json_io import loads
 
 
 def create_application(api, config):
@@ -68,8 +70,9 @@ def create_application(api, config):
             raise typer.Exit(code=1)
 
 
-def get_platform_services(env):
-    """Get platform services for the specified environment"""
+@functools.lru_cache(maxsize=1)
+def _platform_services() -> dict:
+    """Fetch the platform services map for all environments once per process"""
     api = APIClient()
     response = api.get("/schemas/get_platform_services")
     if response.status_code != 200:
@@ -79,7 +82,12 @@ def get_platform_services(env):
             bold=True,
         )
         raise typer.Exit(1)
-    platform_services = response.json()
+    return loads(response.content)
+
+
+def get_platform_services(env):
+    """Get platform services for the specified environment"""
+    platform_services = _platform_services()
     return platform_services.get(env, platform_services.get("dev", []))
 
 
@@ -345,7 +353,7 @@ def create_application_in_developer_studio(api, application_details):
 def register(
     env: str = typer.Argument(
         ...,
-        help=f"Target environment for registration ({', '.join(ENVIRONMENTS)}).",
+        help=f"Target environment for registration ({', '.join(ENVIRONMENT_NAMES)}).",
         show_default=False,
         case_sensitive=False,
     )
@@ -356,7 +364,7 @@ def register(
     handle_env_error(env)
     typer.secho("📦 Registering a new application...", fg=typer.colors.BRIGHT_BLUE)
     config = load_config()
-    api = APIClient(base_url=BASE_URL_BY_ENV[env], env=env)
+    api = APIClient(base_url=get_iam_base_url(env), env=env)
     print("base url:", api.base_url)
     print("env: ", api.env)
     application_details = create_application(api, config)
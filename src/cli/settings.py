@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 import json
+from cli.helpers.json_io import loads
 from cli.helpers.path_utils import get_credentials_path
 
 
@@ -32,17 +33,20 @@ class VersionCheckSettings:
         from cli.helpers.path_utils import get_config_path
 
         self.config_file = get_config_path()
+        self.file_found = False
         self._config = self._load_config()
 
     def _load_config(self) -> dict:
         """Load configuration from file."""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, "r") as f:
-                    return json.load(f)
+            raw = self.config_file.read_bytes()
+        except OSError:
+            return {}
+        self.file_found = True
+        try:
+            return loads(raw)
         except Exception:
-            pass
-        return {}
+            return {}
 
     def _save_config(self) -> None:
         """Save configuration to file."""
@@ -50,6 +54,7 @@ class VersionCheckSettings:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, "w") as f:
                 json.dump(self._config, f, indent=2)
+            self.file_found = True
         except Exception:
             pass
 
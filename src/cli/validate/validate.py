@@ -39,7 +39,8 @@ def load_file_content(file_path: Path) -> dict | None:
         with open(file_path, "r", encoding="utf-8") as f:
             if file_path.suffix in [".yaml", ".yml"]:
                 import yaml
-                return yaml.safe_load(f)
+                from cli.helpers.yaml_io import Loader
+                return yaml.load(f, Loader=Loader)
             else:
                 return json.load(f)
     except json.JSONDecodeError as e:
@@ -4,6 +4,13 @@ from cli.settings import general_config
 import json
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_IJSON_ERRORS = (ijson.JSONError, ijson.IncompleteJSONError) if ijson else ()
+
 
 class FileStructureError(Exception):
     """Raised when the file exists but its internal structure is invalid."""
@@ -11,6 +18,30 @@ class FileStructureError(Exception):
     ...
 
 
+def _read_top_level_fields(f, required: set) -> tuple[dict, set]:
+    """
+    Read top-level fields from a JSON credentials file.
+
+    With ijson available the file is streamed and reading stops as soon as every
+    required field has been seen; otherwise the whole document is parsed.
+    Returns the values of the required fields and the set of keys seen.
+    """
+    if ijson is None:
+        content = json.load(f)
+        if not isinstance(content, dict):
+            raise FileStructureError("Credentials file must contain a JSON object")
+        return {key: content[key] for key in required if key in content}, set(content)
+
+    values, seen = {}, set()
+    for key, value in ijson.kvitems(f, ""):
+        seen.add(key)
+        if key in required:
+            values[key] = value
+            if len(values) == len(required):
+                break
+    return values, seen
+
+
 def creds_existance(file_path: str) -> bool:
     """
     Validate that the credentials file exists and is a valid JSON.
@@ -24,10 +55,10 @@ def creds_existance(file_path: str) -> bool:
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"Required config file '{file_path}' not found")
     try:
-        with open(file_path, "r") as f:
-            file_content = json.loads(f.read())
-            creds_file_keys = set(file_content.keys())
-        if general_config.required_fields_in_credentials_file.issubset(creds_file_keys):
+        required = general_config.required_fields_in_credentials_file
+        with open(file_path, "rb") as f:
+            file_content, creds_file_keys = _read_top_level_fields(f, required)
+        if required.issubset(file_content):
             service_accounts = file_content["serviceAccounts"]
             if not isinstance(service_accounts, dict):
                 raise FileStructureError(
@@ -46,7 +77,7 @@ def creds_existance(file_path: str) -> bool:
         raise FileStructureError(
             f"Missing required {general_config.required_fields_in_credentials_file} in: {MissingData}"
         )
-    except json.decoder.JSONDecodeError as json_error:
+    except (json.decoder.JSONDecodeError, *_IJSON_ERRORS) as json_error:
         raise FileStructureError(
             f"Invalid JSON format in credentials file: {json_error}"
         )
@@ -0,0 +1 @@
+# Applications tests
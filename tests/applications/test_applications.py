@@ -0,0 +1,26 @@
+"""
+Tests for the applications table rows.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.applications.applications import _row_extractor
+
+
+class TestRowExtractor:
+    """Test how application fields map to table cells."""
+
+    def test_falsy_values_are_shown(self):
+        app = {"name": "app", "id": "1", "status": "Deployed", "version": 0}
+        row = _row_extractor(app)(app)
+        assert row == ["app", "1", "Deployed", "0", "-", "-"]
+
+    def test_empty_values_fall_back_to_next_key(self):
+        sample = {"name": "first", "displayName": "x", "id": "1"}
+        app = {"name": "", "displayName": "Second", "id": None, "applicationId": "2"}
+        row = _row_extractor(sample)(app)
+        assert row[:2] == ["Second", "2"]
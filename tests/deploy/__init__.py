@@ -0,0 +1 @@
+# Deploy tests
@@ -0,0 +1,345 @@
+"""
+Tests for the S3 upload path of the deploy command.
+"""
+
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.deploy import deploy
+
+
+class TestS3Proxy:
+    """Test that presigned uploads pick a proxy the way requests does."""
+
+    def setup_method(self):
+        deploy._proxy_for.cache_clear()
+
+    def teardown_method(self):
+        deploy._proxy_for.cache_clear()
+
+    def test_no_proxy_host_goes_direct(self, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        monkeypatch.setenv("NO_PROXY", "s3.amazonaws.com")
+
+        assert deploy._proxy_for("https://bucket.s3.amazonaws.com") is None
+        assert deploy._proxy_for("https://other.example") == "http://proxy.example:3128"
+
+    def test_requests_use_matching_pool(self, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        monkeypatch.setenv("NO_PROXY", "s3.amazonaws.com")
+        pool = deploy._S3Pool(maxsize=2)
+
+        with patch.object(pool._direct, "request", return_value="direct"):
+            with patch("urllib3.ProxyManager") as proxy_manager:
+                proxy_manager.return_value.request.return_value = "proxied"
+                assert (
+                    pool.request("PUT", "https://bucket.s3.amazonaws.com/key")
+                    == "direct"
+                )
+                assert pool.request("PUT", "https://other.example/key") == "proxied"
+
+        proxy_manager.assert_called_once_with("http://proxy.example:3128", maxsize=2)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, body: dict = None):
+        self.status_code = status_code
+        self.status = status_code
+        self.text = f"HTTP {status_code}"
+        self.headers = {"ETag": '"etag"'}
+        self._body = body or {}
+
+    def json(self):
+        return self._body
+
+
+class FakeAPI:
+    """Backend stand-in: every endpoint answers 200 unless listed in `statuses`."""
+
+    def __init__(self, statuses: dict = None):
+        self.statuses = statuses or {}
+        self.calls = []
+
+    def post(self, endpoint: str, json: dict = None, **kwargs):
+        self.calls.append((endpoint, json))
+        status = self.statuses.get(endpoint, 200)
+        if status != 200:
+            return FakeResponse(status)
+        if endpoint == "s3/generate_presigned_urls_batch":
+            return FakeResponse(
+                body={"urls": {key: f"https://s3/{key}" for key in json["keys"]}}
+            )
+        if endpoint == "s3/generate_presigned_url":
+            return FakeResponse(body={"url": f"https://s3/{json['key']}"})
+        return FakeResponse()
+
+    def endpoints(self) -> list:
+        return [endpoint for endpoint, _ in self.calls]
+
+
+class FakeS3Pool:
+    """
+    Presigned PUT stand-in: answers 200 unless the URL ends with a name in `failing`,
+    which get a 403 after `failure_delay` seconds.
+    """
+
+    def __init__(self, failing: tuple = (), failure_delay: float = 0):
+        self.failing = failing
+        self.failure_delay = failure_delay
+        self.urls = []
+
+    def request(self, method: str, url: str, **kwargs):
+        self.urls.append(url)
+        if url.endswith(self.failing):
+            time.sleep(self.failure_delay)
+            return FakeResponse(403)
+        return FakeResponse(200)
+
+    def uploaded(self) -> set:
+        return {url.rsplit("/", 1)[1] for url in self.urls}
+
+
+class TestUploadServices:
+    """Test upload_services_config_to_s3 against a fake backend and S3."""
+
+    @pytest.fixture(autouse=True)
+    def lifecycle(self, tmp_path):
+        deploy._UNSUPPORTED_ENDPOINTS.clear()
+        (tmp_path / "lifecycle_config.yaml").write_text("name: app\n")
+        self.root = tmp_path
+        self.pool = FakeS3Pool()
+        patches = {
+            "get_lifecycle_path": dict(return_value=str(tmp_path)),
+            "get_lifecycle_env_path": dict(return_value=tmp_path / ".env"),
+            "load_env": dict(return_value={}),
+            "_get_s3_pool": dict(side_effect=lambda maxsize: self.pool),
+            "get_lifecycle_config_path": dict(
+                return_value=tmp_path / "lifecycle_config.yaml"
+            ),
+        }
+        with ExitStack() as stack:
+            for name, kwargs in patches.items():
+                stack.enter_context(patch.object(deploy, name, **kwargs))
+            yield
+        deploy._UNSUPPORTED_ENDPOINTS.clear()
+
+    def make_service(self, name: str, files: dict) -> str:
+        folder = self.root / name
+        for relative_path, content in files.items():
+            path = folder / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        folder.mkdir(exist_ok=True)
+        return str(folder)
+
+    def upload(self, services: dict, api: FakeAPI, **kwargs):
+        config = {"core_services": services, **kwargs.pop("config", {})}
+        return deploy.upload_services_config_to_s3(
+            "dep", "app", "dev", deploy_all=True, config=config, api=api, **kwargs
+        )
+
+    def test_uploads_with_batch_presign(self):
+        api = FakeAPI()
+        payload, services = self.upload(
+            {"svc": self.make_service("svc", {"a.txt": "a", "sub/b.txt": "b"})}, api
+        )
+
+        assert services == ["svc"]
+        assert payload == {"svc": {"configuration_file_path": "lifecycle/app/dep/svc"}}
+        assert self.pool.uploaded() == {"a.txt", "b.txt", "lifecycle_config.yaml"}
+
+    def test_batch_404_falls_back_to_direct_upload(self):
+        api = FakeAPI({"s3/generate_presigned_urls_batch": 404})
+        self.upload({"svc": self.make_service("svc", {"a.txt": "a"})}, api)
+
+        assert api.endpoints().count("s3/direct_upload") == 2  # a.txt and the config
+        assert self.pool.urls == []
+
+    def test_direct_404_falls_back_to_single_presign(self):
+        api = FakeAPI(
+            {"s3/generate_presigned_urls_batch": 404, "s3/direct_upload": 404}
+        )
+        self.upload({"svc": self.make_service("svc", {"a.txt": "a"})}, api)
+
+        assert api.endpoints().count("s3/generate_presigned_url") == 2
+        assert self.pool.uploaded() == {"a.txt", "lifecycle_config.yaml"}
+
+    def test_multipart_404_falls_back_to_single_put(self):
+        api = FakeAPI({"s3/create_multipart": 404, "s3/direct_upload": 404})
+        with patch.object(deploy, "MULTIPART_PART_SIZE", 4):
+            self.upload({"svc": self.make_service("svc", {"big.bin": "x" * 10})}, api)
+
+        assert "s3/presign_part" not in api.endpoints()
+        assert api.endpoints().count("s3/generate_presigned_url") == 1
+        assert self.pool.uploaded() == {"big.bin", "lifecycle_config.yaml"}
+
+    def test_duplicates_are_copied(self, capsys):
+        api = FakeAPI()
+        self.upload(
+            {"svc": self.make_service("svc", {"a.txt": "same", "b.txt": "same"})}, api
+        )
+
+        assert api.endpoints().count("s3/copy_object") == 1
+        assert len(self.pool.uploaded() & {"a.txt", "b.txt"}) == 1
+        assert "all 3 files (1 copied from identical files)" in capsys.readouterr().out
+
+    def test_files_of_distinct_sizes_are_not_hashed(self):
+        folder = self.make_service(
+            "svc", {"a.txt": "a", "b.txt": "bb", "c.json": '{"k": 1}'}
+        )
+        with patch.object(
+            deploy, "_content_hash", wraps=deploy._content_hash
+        ) as hashed:
+            self.upload({"svc": folder}, FakeAPI())
+
+        hashed.assert_not_called()
+        assert self.pool.uploaded() == {
+            "a.txt",
+            "b.txt",
+            "c.json",
+            "lifecycle_config.yaml",
+        }
+
+    def test_same_size_different_content_is_uploaded(self):
+        api = FakeAPI()
+        self.upload(
+            {"svc": self.make_service("svc", {"a.txt": "aa", "b.txt": "bb"})}, api
+        )
+
+        assert "s3/copy_object" not in api.endpoints()
+        assert self.pool.uploaded() == {"a.txt", "b.txt", "lifecycle_config.yaml"}
+
+    def test_copy_404_uploads_duplicate(self, capsys):
+        api = FakeAPI({"s3/copy_object": 404})
+        self.upload(
+            {"svc": self.make_service("svc", {"a.txt": "same", "b.txt": "same"})}, api
+        )
+
+        assert self.pool.uploaded() == {"a.txt", "b.txt", "lifecycle_config.yaml"}
+        assert "all 3 files!" in capsys.readouterr().out
+
+    def test_copy_error_is_reported(self, capsys):
+        api = FakeAPI()
+        post = api.post
+
+        def post_or_raise(endpoint, json=None, **kwargs):
+            if endpoint == "s3/copy_object":
+                raise ConnectionError("reset")
+            return post(endpoint, json=json, **kwargs)
+
+        api.post = post_or_raise
+        folder = self.make_service("svc", {"a.txt": "same", "b.txt": "same"})
+        with pytest.raises(typer.Exit):
+            self.upload({"svc": folder}, api, keep_going=True)
+
+        assert "Error copying" in capsys.readouterr().out
+
+    def test_forbidden_upload_stops_run(self, capsys):
+        # Slow enough that the failure is still pending when the walk finishes
+        self.pool.failing = ("a.txt",)
+        self.pool.failure_delay = 0.2
+        with pytest.raises(typer.Exit) as exc_info:
+            self.upload({"svc": self.make_service("svc", {"a.txt": "a"})}, FakeAPI())
+
+        assert exc_info.value.exit_code == 1
+        assert "lifecycle_config.yaml" not in self.pool.uploaded()
+        assert "Upload failed for" in capsys.readouterr().out
+
+    def test_keep_going_reports_every_error(self, capsys):
+        self.pool.failing = ("a.txt", "b.txt")
+        folder = self.make_service("svc", {"a.txt": "a", "b.txt": "b", "c.txt": "c"})
+        with pytest.raises(typer.Exit):
+            self.upload({"svc": folder}, FakeAPI(), keep_going=True)
+
+        out = capsys.readouterr().out
+        assert "a.txt: HTTP 403" in out
+        assert "b.txt: HTTP 403" in out
+        assert {"c.txt", "lifecycle_config.yaml"} <= self.pool.uploaded()
+
+    def test_exclusions(self, capsys):
+        (self.root / deploy.DEPLOY_IGNORE_FILE).write_text("# build output\ndist/\n")
+        folder = self.make_service(
+            "svc",
+            {
+                "a.txt": "a",
+                "debug.log": "log",
+                "conf.example.json": "{}",
+                "dist/out.txt": "out",
+                ".git/HEAD": "ref",
+                "node_modules/m.js": "m",
+            },
+        )
+        self.upload({"svc": folder}, FakeAPI(), config={"deploy_exclude": ["*.log"]})
+
+        assert self.pool.uploaded() == {"a.txt", "m.js", "lifecycle_config.yaml"}
+        assert "Skipped excluded folders in 'svc'" in capsys.readouterr().out
+
+    def test_path_patterns_match_relative_paths(self):
+        (self.root / deploy.DEPLOY_IGNORE_FILE).write_text(
+            "build/out\ndocs/*.md\n/top.txt\n"
+        )
+        folder = self.make_service(
+            "svc",
+            {
+                "build/out/a.bin": "a",
+                "build/keep.bin": "keep",
+                "docs/guide.md": "doc",
+                "docs/api.txt": "api",
+                "readme.md": "readme",
+                "top.txt": "top",
+                "sub/top.txt": "subtop",
+            },
+        )
+        self.upload({"svc": folder}, FakeAPI())
+
+        assert self.pool.uploaded() == {
+            "keep.bin",
+            "api.txt",
+            "readme.md",
+            "top.txt",  # sub/top.txt; the root one is excluded
+            "lifecycle_config.yaml",
+        }
+        assert not any(url.endswith("/svc/top.txt") for url in self.pool.urls)
+
+    def test_negated_patterns_are_reported(self, capsys):
+        (self.root / deploy.DEPLOY_IGNORE_FILE).write_text("*.log\n\n!keep.log\n")
+        folder = self.make_service(
+            "svc", {"a.log": "a", "keep.log": "keep", "a.txt": "text"}
+        )
+        self.upload(
+            {"svc": folder}, FakeAPI(), config={"deploy_exclude": ["!other.log"]}
+        )
+
+        err = capsys.readouterr().err
+        assert f"{deploy.DEPLOY_IGNORE_FILE}:3: negated pattern '!keep.log'" in err
+        assert "deploy_exclude[0]: negated pattern '!other.log'" in err
+        assert self.pool.uploaded() == {"a.txt", "lifecycle_config.yaml"}
+
+    def test_service_without_files_is_skipped(self, capsys):
+        payload, services = self.upload(
+            {
+                "svc": self.make_service("svc", {"a.txt": "a"}),
+                "empty": self.make_service("empty", {"conf.example.json": "{}"}),
+            },
+            FakeAPI(),
+        )
+
+        assert services == ["svc"]
+        assert "empty" not in payload
+        assert "No files to upload for 'empty'" in capsys.readouterr().out
+
+    def test_no_service_with_files_exits(self):
+        with pytest.raises(typer.Exit) as exc_info:
+            self.upload({"empty": self.make_service("empty", {})}, FakeAPI())
+
+        assert exc_info.value.exit_code == 1
+        assert self.pool.urls == []
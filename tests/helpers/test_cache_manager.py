@@ -0,0 +1,82 @@
+"""
+Tests for the version cache in VersionManager.
+"""
+
+import json
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.helpers.cache_manager import GITHUB_TIMEOUT, VersionManager
+
+
+def _write_cache(path: Path, version: str, age: timedelta) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {"version": version, "epoch": int(time.time() - age.total_seconds())}
+        )
+    )
+
+
+class TestVersionCache:
+    """Test stale-while-revalidate behaviour of the version cache."""
+
+    def test_fresh_cache_skips_lookup(self, tmp_path):
+        cache_file = tmp_path / ".version_cache.json"
+        _write_cache(cache_file, "1.0.0", timedelta(minutes=5))
+
+        with patch.object(VersionManager, "get_latest_github_tag") as tag:
+            manager = VersionManager(cache_file=cache_file)
+
+        assert manager.latest_version == "1.0.0"
+        tag.assert_not_called()
+
+    def test_stale_cache_is_served_and_refreshed(self, tmp_path):
+        cache_file = tmp_path / ".version_cache.json"
+        _write_cache(cache_file, "1.0.0", timedelta(days=2))
+
+        with patch.object(
+            VersionManager, "get_latest_github_tag", return_value="2.0.0"
+        ):
+            with patch("cli.helpers.cache_manager.threading.Thread") as thread:
+                with patch("cli.helpers.cache_manager.atexit.register") as register:
+                    thread.return_value.start.side_effect = (
+                        lambda: thread.call_args.kwargs["target"]()
+                    )
+                    manager = VersionManager(cache_file=cache_file)
+
+        assert manager.latest_version == "1.0.0"
+        assert json.loads(cache_file.read_text())["version"] == "2.0.0"
+        # Short commands wait for the refresh at exit instead of killing it
+        register.assert_called_once_with(thread.return_value.join, GITHUB_TIMEOUT)
+
+    def test_failed_refresh_keeps_stale_value(self, tmp_path):
+        cache_file = tmp_path / ".version_cache.json"
+        _write_cache(cache_file, "1.0.0", timedelta(days=2))
+
+        with patch.object(VersionManager, "get_latest_github_tag", return_value=None):
+            with patch("cli.helpers.cache_manager.threading.Thread"):
+                with patch("cli.helpers.cache_manager.atexit.register"):
+                    manager = VersionManager(cache_file=cache_file)
+                    assert manager._refresh() is None
+
+        assert json.loads(cache_file.read_text())["version"] == "1.0.0"
+
+    def test_legacy_timestamp_entry_is_stale(self, tmp_path):
+        cache_file = tmp_path / ".version_cache.json"
+        cache_file.write_text(
+            json.dumps({"version": "1.0.0", "timestamp": "2025-01-01T00:00:00"})
+        )
+
+        with patch("cli.helpers.cache_manager.threading.Thread") as thread:
+            with patch("cli.helpers.cache_manager.atexit.register"):
+                manager = VersionManager(cache_file=cache_file)
+
+        assert manager.latest_version == "1.0.0"
+        thread.return_value.start.assert_called_once()
@@ -0,0 +1,88 @@
+"""
+Tests for config loading in cli.helpers.file.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.helpers import file as file_helpers
+
+
+class TestLoadConfig:
+    """Test the per-process config memo."""
+
+    def _use_config(self, monkeypatch, tmp_path, content):
+        path = tmp_path / "lifecycle_config.yaml"
+        path.write_text(content)
+        monkeypatch.setattr(file_helpers, "config_path", path)
+        file_helpers.load_config.cache_clear()
+        return path
+
+    def test_returns_independent_copies(self, monkeypatch, tmp_path):
+        self._use_config(monkeypatch, tmp_path, "application:\n  name: app\n")
+        config = file_helpers.load_config()
+        config["application"]["name"] = "changed"
+        assert file_helpers.load_config()["application"]["name"] == "app"
+
+    def test_reparses_after_file_changes(self, monkeypatch, tmp_path):
+        path = self._use_config(monkeypatch, tmp_path, "application:\n  name: app\n")
+        file_helpers.load_config()
+        path.write_text("application:\n  name: other\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert file_helpers.load_config()["application"]["name"] == "other"
+
+    def test_save_config_invalidates_cache(self, monkeypatch, tmp_path):
+        self._use_config(monkeypatch, tmp_path, "application:\n  name: app\n")
+        file_helpers.load_config()
+        file_helpers.save_config({"application": {"name": "saved"}})
+        assert file_helpers.load_config()["application"]["name"] == "saved"
+
+
+class TestInjectEnvIntoSchema:
+    """Test env var injection into uploaded config files."""
+
+    def test_returns_encoded_json(self, tmp_path):
+        path = tmp_path / "schema.json"
+        path.write_text('{"url": "${LC.HOST}/api", "port": 8080}')
+        content = file_helpers.inject_env_into_schema(
+            str(path), {"HOST": "example.com"}
+        )
+        assert content == b'{\n  "url": "example.com/api",\n  "port": 8080\n}'
+
+    def test_returns_encoded_yaml(self, tmp_path):
+        path = tmp_path / "schema.yaml"
+        path.write_text("url: ${LC.HOST}/api\n")
+        content = file_helpers.inject_env_into_schema(
+            str(path), {"HOST": "example.com"}
+        )
+        assert content == b"url: example.com/api\n"
+
+    def test_rerenders_after_file_changes(self, tmp_path):
+        path = tmp_path / "schema.yaml"
+        path.write_text("url: ${LC.HOST}\n")
+        assert (
+            file_helpers.inject_env_into_schema(str(path), {"HOST": "a"}) == b"url: a\n"
+        )
+        assert (
+            file_helpers.inject_env_into_schema(str(path), {"HOST": "b"}) == b"url: b\n"
+        )
+        path.write_text("host: ${LC.HOST}\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert (
+            file_helpers.inject_env_into_schema(str(path), {"HOST": "b"})
+            == b"host: b\n"
+        )
+
+    def test_undefined_variable_raises(self, tmp_path):
+        path = tmp_path / "schema.json"
+        path.write_text('{"items": ["plain", "${LC.MISSING}"]}')
+        with pytest.raises(ValueError, match="MISSING"):
+            file_helpers.inject_env_into_schema(str(path), {"HOST": "example.com"})
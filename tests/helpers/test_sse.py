@@ -0,0 +1,38 @@
+"""
+Tests for the Server-Sent Events reader.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.helpers.sse import iter_event_data
+
+
+def _response(*chunks):
+    response = MagicMock()
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+class TestIterEventData:
+    """Test splitting an event stream into event payloads."""
+
+    def test_yields_data_per_event(self):
+        response = _response(b'data: {"a": 1}\n\ndata: {"b": 2}\n\n')
+        assert list(iter_event_data(response)) == [b'{"a": 1}', b'{"b": 2}']
+
+    def test_joins_events_split_across_chunks(self):
+        response = _response(b'data: {"a"', b": 1}\r", b"\n\r\n")
+        assert list(iter_event_data(response)) == [b'{"a": 1}']
+
+    def test_joins_multiline_data_and_skips_comments(self):
+        response = _response(b": keep-alive\n\nid: 7\ndata: first\ndata:second\n\n")
+        assert list(iter_event_data(response)) == [b"first\nsecond"]
+
+    def test_drops_unterminated_event(self):
+        response = _response(b"data: done\n\ndata: partial\n")
+        assert list(iter_event_data(response)) == [b"done"]
@@ -0,0 +1,36 @@
+"""
+Tests for table column sizing helpers.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.helpers.table import MIN_COLUMN_WIDTH, fit_to_terminal, truncate
+
+
+class TestTable:
+    """Test truncation and terminal fitting."""
+
+    def test_truncate_keeps_short_text(self):
+        assert truncate("deployed", 10) == "deployed"
+
+    def test_truncate_marks_cut_with_ellipsis(self):
+        assert truncate("validation in progress", 10) == "validatio…"
+
+    def test_fit_leaves_piped_output_alone(self):
+        with patch("cli.helpers.table.sys.stdout.isatty", return_value=False):
+            assert fit_to_terminal([40, 36, 22], 2) == (40, 36, 22)
+
+    def test_fit_shrinks_to_terminal(self):
+        terminal_size = type("Size", (), {"columns": 54})()
+        with patch("cli.helpers.table.sys.stdout.isatty", return_value=True):
+            with patch(
+                "cli.helpers.table.shutil.get_terminal_size", return_value=terminal_size
+            ):
+                widths = fit_to_terminal([40, 40, 20], 2)
+        assert sum(widths) + 4 <= 54
+        assert min(widths) >= MIN_COLUMN_WIDTH
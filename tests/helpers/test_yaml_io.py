@@ -0,0 +1,51 @@
+"""
+Tests for the YAML loader/dumper selection.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from cli.helpers.yaml_io import Loader, Dumper, HAS_LIBYAML, dump_atomic
+
+
+class TestYamlIo:
+    """Test the shared YAML Loader/Dumper."""
+
+    def test_prefers_libyaml_when_available(self):
+        """Verify the C loader/dumper are used when PyYAML has libyaml."""
+        if yaml.__with_libyaml__:
+            assert HAS_LIBYAML
+            assert Loader is yaml.CSafeLoader
+            assert Dumper is yaml.CSafeDumper
+        else:
+            assert Loader is yaml.SafeLoader
+            assert Dumper is yaml.SafeDumper
+
+    def test_round_trip_preserves_key_order(self):
+        """Verify dump/load round trips config data without sorting keys."""
+        data = {
+            "application": {"name": "app", "app_version": "1.0.0"},
+            "core_services": {},
+        }
+        dumped = yaml.dump(data, Dumper=Dumper, sort_keys=False)
+        assert dumped.index("application") < dumped.index("core_services")
+        assert yaml.load(dumped, Loader=Loader) == data
+
+    def test_loader_is_safe(self):
+        """Verify arbitrary Python object tags are rejected."""
+        with pytest.raises(yaml.YAMLError):
+            yaml.load("!!python/object/apply:os.system ['true']", Loader=Loader)
+
+    def test_dump_atomic_replaces_file(self, tmp_path):
+        """Verify dump_atomic writes the document and leaves no temp file behind."""
+        path = tmp_path / "lifecycle_config.yaml"
+        path.write_text("old: true\n")
+        dump_atomic({"new": True}, path)
+        assert yaml.load(path.read_text(), Loader=Loader) == {"new": True}
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,33 @@
+"""
+Tests for the generated sub-app registry.
+
+src/cli/_registry.py is produced by scripts/gen_registry.py; these tests fail when it
+drifts from what runtime discovery finds, i.e. when the script needs to be re-run.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cli._registry import SUBAPPS
+from cli.helpers.custom_typer import iter_typer_apps
+
+
+class TestRegistry:
+    """Test that the static registry matches runtime discovery"""
+
+    def test_names_match_discovery(self):
+        # Order matters too: it is the order --help lists the sub-apps in
+        registered = [name for name, _ in SUBAPPS]
+        discovered = [name for name, _ in iter_typer_apps()]
+        assert registered == discovered
+
+    def test_targets_resolve_to_discovered_apps(self):
+        discovered = dict(iter_typer_apps())
+        for name, target_path in SUBAPPS:
+            module_name, attr_name = target_path.split(":")
+            target = getattr(importlib.import_module(module_name), attr_name)
+            assert target is discovered[name], f"{name} -> {target_path}"